@@ -1,67 +1,30 @@
 # AudioToChat.py
-import os
-from datetime import datetime, date
-
-def setup_log_rotation(log_file_path: str = "transcription.log"):
-    """
-    Clear the log file if it's older than today to keep only 1 day of logs.
-    """
-    try:
-        if os.path.exists(log_file_path):
-            # Get file modification time
-            file_mod_time = datetime.fromtimestamp(os.path.getmtime(log_file_path)).date()
-            today = date.today()
-            
-            # Clear the file if it's older than today
-            if file_mod_time < today:
-                with open(log_file_path, 'w') as f:
-                    f.write("")  # Clear the file
-                print(f"Log file {log_file_path} cleared (was from {file_mod_time}, today is {today})")
-            else:
-                print(f"Log file {log_file_path} is current (from {file_mod_time})")
-    except Exception as e:
-        print(f"Warning: Could not check/clear log file {log_file_path}: {e}")
-
-# Setup log rotation FIRST, before any imports that might trigger logging
-setup_log_rotation("transcription.log")
-
-# Now import everything else
 import signal
 import sys
 import threading
+import time
 import queue
 import logging
 import tkinter as tk
-from typing import List, Optional
-
-# PyTorch import is conditional - only needed for CUDA detection
-try:
-    import torch
-    TORCH_AVAILABLE = True
-except ImportError:
-    TORCH_AVAILABLE = False
+from typing import List, Optional, Tuple
+from collections import deque
 
 from TopicsUI import UIController, Topic
 from managers import StateManager, ServiceManager
 from topic_router import TopicRouter
 from browser import SUBMISSION_SUCCESS, SUBMISSION_FAILED_INPUT_UNAVAILABLE, SUBMISSION_FAILED_HUMAN_VERIFICATION_DETECTED, SUBMISSION_NO_CONTENT
 from exception_notifier import exception_notifier
+from queue_utils import drain_queue
+from logging_utils import setup_logging
 
 # Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler("transcription.log"),
-        logging.StreamHandler()
-    ]
-)
+log_listener = setup_logging("transcription.log")
 logger = logging.getLogger(__name__)
 
-# Enable TF32 for better performance if available
-if TORCH_AVAILABLE and torch.cuda.is_available():
-    torch.backends.cuda.matmul.allow_tf32 = True
-    torch.backends.cudnn.allow_tf32 = True
+# Delay before applying browser submission results, so a burst of them costs one UI update (~30 Hz)
+UI_EVENT_FRAME_MS = 33
+# How long shutdown waits for the topic processing thread to finish its current burst; it runs on the Tk thread
+TOPIC_THREAD_JOIN_TIMEOUT_S = 1.0
 
 class AudioToChat:
     """
@@ -72,15 +35,30 @@ class AudioToChat:
         self.root.title("Audio Transcription Processor")
         self.root.geometry("900x650")
 
-        # Queues for inter-thread communication
-        self.audio_queue = queue.Queue()
-        self.transcribed_topics_queue = queue.Queue()
+        # Queues for inter-thread communication. SimpleQueue is C-implemented with a
+        # single lock and no task bookkeeping; transcribed topics have exactly one
+        # producer (transcriber) and one consumer (topic_processing_loop).
+        self.audio_queue = queue.SimpleQueue()
+        self.transcribed_topics_queue = queue.SimpleQueue()
+        # Manual reconnection requests from the UI, run in order by one long-lived worker
+        self.reconnect_queue = queue.SimpleQueue()
 
         # Core components
         self.state_manager = StateManager()
         self.ui_controller = UIController(self.root, self)
         self.service_manager = ServiceManager(self.state_manager, self.ui_controller, exception_notifier)
         self.topic_router = TopicRouter(self.state_manager, self.service_manager, self.ui_controller)
+        # Submission results from the browser thread, applied on the Tk thread once per frame
+        self._ui_events = deque()
+        self._ui_events_pending = False
+        # Cleared before the window goes away; worker threads check this instead of winfo_exists(),
+        # which is a Tcl call that has to be marshalled onto the Tk thread
+        self._root_alive = True
+        self._new_chat_lock = threading.Lock()  # Held while a "New Thread" request is in flight
+        # shutdown() can be reached from SIGINT, WM_DELETE_WINDOW and run()'s finally; only the first call proceeds
+        self._shutdown_started = threading.Event()
+        self._shutdown_lock = threading.Lock()
+        self._topic_thread = None
         
         # Initialize exception notifier with UI callback
         exception_notifier.set_ui_update_callback(self._thread_safe_status_update)
@@ -107,8 +85,11 @@ class AudioToChat:
                 return
 
             # Start the topic processing thread
-            topic_thread = threading.Thread(target=self.topic_processing_loop, daemon=True)
-            topic_thread.start()
+            self._topic_thread = threading.Thread(target=self.topic_processing_loop, daemon=True)
+            self._topic_thread.start()
+
+            # Start the worker that runs manual browser/audio reconnections off the Tk thread
+            threading.Thread(target=self.reconnect_worker_loop, name="ReconnectWorker", daemon=True).start()
 
             logger.info("Starting main UI loop")
             self.root.mainloop()
@@ -119,19 +100,24 @@ class AudioToChat:
             self.shutdown()
 
     def topic_processing_loop(self):
-        """Continuously checks for transcribed topics and routes them."""
-        while self.state_manager.is_active():
-            try:
-                topic = self.transcribed_topics_queue.get(timeout=1)
-                self.topic_router.route_topic(topic)
-                self.transcribed_topics_queue.task_done()
-            except queue.Empty:
-                continue
+        """Routes transcribed topics, one burst per wake-up, until shutdown enqueues a None sentinel."""
+        while True:
+            batch = [self.transcribed_topics_queue.get()] + drain_queue(self.transcribed_topics_queue)
+            if None in batch:
+                # Route what arrived before the sentinel, then stop
+                batch = batch[:batch.index(None)]
+                if batch:
+                    self.topic_router.route_topic_batch(batch)
+                break
+            self.topic_router.route_topic_batch(batch)
+        logger.info("Topic processing loop finished.")
 
     def shutdown(self):
-        if not self.state_manager.is_active():
-            logger.info("Shutdown already in progress.")
-            return
+        with self._shutdown_lock:
+            if self._shutdown_started.is_set():
+                logger.info("Shutdown already in progress.")
+                return
+            self._shutdown_started.set()
 
         logger.info("Shutdown process started.")
         
@@ -147,8 +133,27 @@ class AudioToChat:
                 logger.error(f"Error displaying shutdown message: {e}")
         
         self.state_manager.shutdown()
+        self.reconnect_queue.put(None)
         self.service_manager.shutdown_services()
 
+        if hasattr(self, 'ui_controller') and self.ui_controller:
+            self.ui_controller.stop_topic_events()
+        # Wake the topic processing loop so it exits, and wait for it so every topic it routed
+        # is in the UI queue before storage is closed
+        self.transcribed_topics_queue.put(None)
+        if self._topic_thread and self._topic_thread is not threading.current_thread():
+            self._topic_thread.join(timeout=TOPIC_THREAD_JOIN_TIMEOUT_S)
+            if self._topic_thread.is_alive():
+                logger.warning("Topic processing thread did not stop before shutdown; topics it still routes are not saved.")
+
+        # Flush queued topic writes and close the session file before the process can exit
+        if hasattr(self, 'ui_controller') and self.ui_controller:
+            try:
+                self.ui_controller.close_storage()
+            except Exception as e:
+                logger.error(f"Error closing topic storage during shutdown: {e}")
+
+        self._root_alive = False
         if self.root and self.root.winfo_exists():
             self.root.destroy()
             logger.info("Tkinter root window destroyed.")
@@ -159,6 +164,8 @@ class AudioToChat:
         self.on_closing_ui_initiated()
 
     def on_closing_ui_initiated(self):
+        if self._shutdown_started.is_set():
+            return
         logger.info("UI window closing event triggered.")
         
         # Display shutdown message in status bar
@@ -170,6 +177,7 @@ class AudioToChat:
             except Exception as e:
                 logger.error(f"Error displaying shutdown message: {e}")
         
+        self._root_alive = False
         self.shutdown()
 
     # --- Callbacks for UIController ---
@@ -193,128 +201,174 @@ class AudioToChat:
             logger.error("Cannot submit topics, browser manager not initialized.")
 
     def request_new_ai_thread(self, context_text: Optional[str] = None):
-        if self.service_manager.browser_manager:
-            self.service_manager.browser_manager.new_chat(context_text, force_new_thread_and_init_prompt=True)
+        if not self.service_manager.browser_manager:
+            return
+        if not self._new_chat_lock.acquire(blocking=False):
+            logger.info("New AI thread request already in progress, ignoring duplicate.")
+            return
+        # Prompts are cached; this only re-reads them if the files were edited
+        self.service_manager.refresh_browser_prompts()
+        # Selenium navigation + prompt submission takes seconds, so keep it off the Tk thread
+        threading.Thread(target=self._do_new_chat, args=(context_text,), name="NewChat", daemon=True).start()
+
+    def _do_new_chat(self, context_text: Optional[str]):
+        try:
+            success = self.service_manager.browser_manager.new_chat(context_text, force_new_thread_and_init_prompt=True)
+        except Exception as e:
+            logger.error(f"Error starting new AI thread: {e}")
+            success = False
+        finally:
+            self._new_chat_lock.release()
+        
+        if success:
+            # A wrong-page warning from navigation is more useful than a generic ready message
+            if getattr(self.service_manager.browser_manager, 'on_correct_page', True):
+                self._thread_safe_status_update("browser_ready", "Status: New AI thread started.")
+        else:
+            self._thread_safe_status_update("error", "Status: Failed to start new AI thread.")
 
     def request_manual_reconnection(self):
         """Handle manual reconnection request from UI."""
         if self.service_manager.browser_manager and self.service_manager.browser_manager.reconnection_manager:
-            # Run reconnection in a separate thread to avoid blocking UI
-            def _reconnect():
-                try:
-                    success = self.service_manager.browser_manager.reconnection_manager.attempt_reconnection()
-                    
-                    # Dropdown automatically resets, no need to re-enable
-                    
-                except Exception as e:
-                    logger.error(f"Error during manual reconnection: {e}")
-                    # Dropdown automatically resets, no need to re-enable
-            
-            import threading
-            reconnect_thread = threading.Thread(target=_reconnect, daemon=True)
-            reconnect_thread.start()
+            # Run reconnection on the reconnect worker to avoid blocking UI
+            self.reconnect_queue.put(self._do_browser_reconnect)
         else:
             logger.error("Cannot perform manual reconnection: browser manager or reconnection manager not available.")
 
+    def _do_browser_reconnect(self):
+        try:
+            self.service_manager.browser_manager.reconnection_manager.attempt_reconnection()
+            # Dropdown automatically resets, no need to re-enable
+        except Exception as e:
+            logger.error(f"Error during manual reconnection: {e}")
+
     def request_manual_audio_reconnection(self):
         """Handle manual audio reconnection request from UI."""
         if self.service_manager.audio_monitor:
-            # Run audio reconnection in a separate thread to avoid blocking UI
-            def _audio_reconnect():
-                try:
-                    logger.info("Manual audio reconnection requested")
-                    
-                    # Check if listening is currently active and turn it off if needed
-                    was_listening = self.state_manager.is_listening()
-                    if was_listening:
-                        logger.info("Turning off listening mode for audio reconnection")
-                        self.state_manager.stop_listening()
-                        # Give threads a moment to stop listening
-                        time.sleep(0.5)
-                    
-                    # Update UI to show that we're refreshing the microphone list (thread-safe)
-                    self.root.after(0, lambda: self.ui_controller.update_browser_status("info", "Status: Refreshing microphone list..."))
-                    
-                    # Attempt reconnection for both audio sources together
-                    success = self.service_manager.audio_monitor.reconnect_all_audio_sources()
-                    
-                    if success and was_listening:
-                        # Restart listening if it was on before
-                        logger.info("Restarting listening mode after successful audio reconnection")
-                        time.sleep(0.5)  # Give a moment for reconnection to settle
-                        self.state_manager.start_listening()
-                    
-                except Exception as e:
-                    logger.error(f"Error during manual audio reconnection: {e}")
-                    # Thread-safe UI update
-                    self.root.after(0, lambda: self.ui_controller.update_browser_status("error", f"Status: Audio reconnection error - {str(e)}"))
-            
-            import threading
-            import time
-            audio_reconnect_thread = threading.Thread(target=_audio_reconnect, daemon=True)
-            audio_reconnect_thread.start()
+            # Run audio reconnection on the reconnect worker to avoid blocking UI
+            self.reconnect_queue.put(self._do_audio_reconnect)
         else:
             logger.error("Cannot perform manual audio reconnection: audio monitor not available.")
             self.ui_controller.update_browser_status("error", "Status: Audio monitor not available")
 
+    def _do_audio_reconnect(self):
+        try:
+            logger.info("Manual audio reconnection requested")
+            
+            # Check if listening is currently active and turn it off if needed
+            was_listening = self.state_manager.is_listening()
+            if was_listening:
+                logger.info("Turning off listening mode for audio reconnection")
+                self.state_manager.stop_listening()
+                # Give threads a moment to stop listening
+                time.sleep(0.5)
+            
+            # Update UI to show that we're refreshing the microphone list (thread-safe)
+            self._thread_safe_status_update("info", "Status: Refreshing microphone list...")
+            
+            # Attempt reconnection for both audio sources together
+            success = self.service_manager.audio_monitor.reconnect_all_audio_sources()
+            
+            if success and was_listening:
+                # Restart listening if it was on before
+                logger.info("Restarting listening mode after successful audio reconnection")
+                time.sleep(0.5)  # Give a moment for reconnection to settle
+                self.state_manager.start_listening()
+            
+        except Exception as e:
+            logger.error(f"Error during manual audio reconnection: {e}")
+            # Thread-safe UI update
+            self._thread_safe_status_update("error", f"Status: Audio reconnection error - {str(e)}")
+
+    def reconnect_worker_loop(self):
+        """Runs manual reconnection requests one at a time until shutdown enqueues a None sentinel."""
+        while True:
+            task = self.reconnect_queue.get()
+            if task is None:
+                break
+            task()
+        logger.info("Reconnect worker finished.")
+
     def update_ui_after_submission(self, status: str, submitted_topics: List[Topic]):
-        if not self.root or not self.root.winfo_exists():
+        if not self._root_alive:
             return
 
-        def _update_task():
-            if status == SUBMISSION_SUCCESS:
-                is_manual_submission = any(not t.submitted for t in submitted_topics) if submitted_topics else False
-                is_auto_submission = any(t.submitted for t in submitted_topics) if submitted_topics else False
-                
-                if is_manual_submission:
-                    # Manual submission - clear topics from UI as before
-                    self.ui_controller.clear_successfully_submitted_topics(submitted_topics)
-                    self.ui_controller.clear_full_text_display()
-                    self.ui_controller.update_browser_status("browser_ready", "Status: Topics submitted successfully.")
-                    if self.service_manager.browser_manager:
-                        self.service_manager.browser_manager.focus_browser_window()
-                elif is_auto_submission:
-                    # Auto submission - topics are already marked as submitted and grayed out
-                    self.ui_controller.update_browser_status("browser_ready", "Status: Auto-submitted topics sent successfully.")
-                else:
-                    # No topics (wake-up or empty submission)
-                    self.ui_controller.update_browser_status("browser_ready", "Status: Submission completed.")
-                    
-            elif status == SUBMISSION_FAILED_HUMAN_VERIFICATION_DETECTED:
-                # For failed submissions, unmark auto-submitted topics so they can be retried
-                if submitted_topics:
-                    self._unmark_failed_auto_submitted_topics(submitted_topics)
-                self.ui_controller.update_browser_status("browser_human_verification", "AI: Verify Human! (Topics NOT Sent)")
-            elif status == SUBMISSION_FAILED_INPUT_UNAVAILABLE:
-                # For failed submissions, unmark auto-submitted topics so they can be retried
-                if submitted_topics:
-                    self._unmark_failed_auto_submitted_topics(submitted_topics)
-                self.ui_controller.update_browser_status("browser_input_unavailable", "AI: Input Unavail. (Topics NOT Sent)")
-            elif status == SUBMISSION_NO_CONTENT:
-                 self.ui_controller.update_browser_status("warning", "Status: No content was sent.")
-            elif status == "connection_lost":
-                self.ui_controller.update_browser_status("connection_lost")
-            elif status == "reconnecting":
-                self.ui_controller.update_browser_status("reconnecting")
-            elif status == "reconnected":
-                self.ui_controller.update_browser_status("reconnected")
-            elif status == "connection_failed":
-                self.ui_controller.update_browser_status("connection_failed")
-            else:
-                # For failed submissions, unmark auto-submitted topics so they can be retried
-                if submitted_topics:
-                    self._unmark_failed_auto_submitted_topics(submitted_topics)
-                self.ui_controller.update_browser_status("error", "Status: Failed to send topics to AI.")
+        self._ui_events.append((status, submitted_topics))
+        # One Tk callback per frame: results arriving before it runs are folded into it
+        if self._ui_events_pending:
+            return
+        self._ui_events_pending = True
+        try:
+            self.root.after(UI_EVENT_FRAME_MS, self._drain_ui_events)
+        except (tk.TclError, RuntimeError):
+            # Window was destroyed between the check and scheduling
+            self._ui_events_pending = False
+
+    def _drain_ui_events(self):
+        """Apply queued submission results on the Tk thread, showing only the latest status."""
+        # Cleared before draining so a result queued from here on schedules its own frame
+        self._ui_events_pending = False
+        latest_status = None
+        focus_browser = False
+        while self._ui_events:
+            status, submitted_topics = self._ui_events.popleft()
+            latest_status, focus = self._apply_submission_result(status, submitted_topics)
+            focus_browser = focus_browser or focus
+
+        if latest_status:
+            self.ui_controller.update_browser_status(*latest_status)
+        if focus_browser and self.service_manager.browser_manager:
+            self.service_manager.browser_manager.focus_browser_window()
+
+    def _apply_submission_result(self, status: str, submitted_topics: List[Topic]) -> Tuple[Tuple[str, Optional[str]], bool]:
+        """
+        Update the topic list for one submission result.
         
-        self.root.after(0, _update_task)
+        Returns the (status_key, message) to show and whether to focus the browser.
+        """
+        if status == SUBMISSION_SUCCESS:
+            is_manual_submission = any(not t.submitted for t in submitted_topics) if submitted_topics else False
+            is_auto_submission = any(t.submitted for t in submitted_topics) if submitted_topics else False
+            
+            if is_manual_submission:
+                # Manual submission - clear topics from UI as before
+                self.ui_controller.clear_successfully_submitted_topics(submitted_topics)
+                self.ui_controller.clear_full_text_display()
+                return ("browser_ready", "Status: Topics submitted successfully."), True
+            elif is_auto_submission:
+                # Auto submission - topics are already marked as submitted and grayed out
+                return ("browser_ready", "Status: Auto-submitted topics sent successfully."), False
+            else:
+                # No topics (wake-up or empty submission)
+                return ("browser_ready", "Status: Submission completed."), False
+                
+        elif status == SUBMISSION_FAILED_HUMAN_VERIFICATION_DETECTED:
+            # For failed submissions, unmark auto-submitted topics so they can be retried
+            if submitted_topics:
+                self._unmark_failed_auto_submitted_topics(submitted_topics)
+            return ("browser_human_verification", "AI: Verify Human! (Topics NOT Sent)"), False
+        elif status == SUBMISSION_FAILED_INPUT_UNAVAILABLE:
+            # For failed submissions, unmark auto-submitted topics so they can be retried
+            if submitted_topics:
+                self._unmark_failed_auto_submitted_topics(submitted_topics)
+            return ("browser_input_unavailable", "AI: Input Unavail. (Topics NOT Sent)"), False
+        elif status == SUBMISSION_NO_CONTENT:
+            return ("warning", "Status: No content was sent."), False
+        elif status in ("connection_lost", "reconnecting", "reconnected", "connection_failed"):
+            return (status, None), False
+        else:
+            # For failed submissions, unmark auto-submitted topics so they can be retried
+            if submitted_topics:
+                self._unmark_failed_auto_submitted_topics(submitted_topics)
+            return ("error", "Status: Failed to send topics to AI."), False
     
     def _unmark_failed_auto_submitted_topics(self, failed_topics: List[Topic]):
         """Unmark auto-submitted topics that failed so they can be retried"""
         self.ui_controller.unmark_failed_auto_submitted_topics(failed_topics)
 
     def _thread_safe_status_update(self, status_key: str, message: str):
-        """Thread-safe wrapper for UI status updates from exception notifier."""
-        if not self.root or not self.root.winfo_exists():
+        """Thread-safe wrapper for UI status updates from worker threads and the exception notifier."""
+        if not self._root_alive:
             return
         
         def _update_status():
@@ -323,9 +377,18 @@ class AudioToChat:
             except Exception as e:
                 logger.error(f"Error updating status from exception notifier: {e}")
         
-        self.root.after(0, _update_status)
+        try:
+            self.root.after(0, _update_status)
+        except (tk.TclError, RuntimeError):
+            # Window was destroyed between the check and scheduling
+            pass
 
 def main():
+    # Recorder threads block in PortAudio and inference runs out of process or in
+    # CTranslate2, both of which release the GIL; a free-threaded build only helps the
+    # remaining pure-Python work. Each mic_data[source] entry is owned by one recorder.
+    gil_enabled = sys._is_gil_enabled() if hasattr(sys, "_is_gil_enabled") else True
+    logger.info(f"Python {sys.version.split()[0]} - GIL {'enabled' if gil_enabled else 'disabled (free-threaded build)'}")
     app = AudioToChat()
     app.run()
 
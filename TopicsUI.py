@@ -1,28 +1,35 @@
 # TopicsUI.py
 import tkinter as tk
 from datetime import datetime
+import logging
 import queue
 import threading
-import logging
-from dataclasses import dataclass
-from typing import List, Optional
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional, Tuple
 import pyperclip
 
 from ui_view import UIView
 from topic_storage import TopicStorageManager
 from config import TOPIC_STORAGE_FOLDER
+from queue_utils import drain_queue
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler("transcription.log"),
-        logging.StreamHandler()
-    ]
-)
+# Logging is configured by the application entry point (logging_utils.setup_logging, called from AudioToChat)
 logger = logging.getLogger(__name__)
 
+# Virtual event fired by producers after queueing a topic so the Tk thread drains it.
+TOPIC_ADDED_EVENT = "<<TopicAdded>>"
+# Max topics handled per drain so a burst can't stall the Tk event loop.
+TOPIC_DRAIN_BATCH_SIZE = 64
+# Cap on topics kept in the list; past it the oldest unselected topics are removed from the list.
+# Trimming goes down to MAX_TOPICS - TOPIC_EVICTION_SLACK so the full redraw it causes is rare.
+MAX_TOPICS = 10000
+TOPIC_EVICTION_SLACK = 1000
+# How long close_storage waits for queued topic writes to reach disk; it runs on the Tk thread
+STORAGE_SHUTDOWN_TIMEOUT_S = 1.0
+# Status keys logged at WARNING; everything else is logged at INFO
+_WARNING_STATUS_KEYS = frozenset({"error", "browser_human_verification", "warning", "browser_input_unavailable"})
+
 @dataclass
 class Topic:
     text: str
@@ -30,10 +37,20 @@ class Topic:
     source: str  # Either "ME" or "OTHERS"
     selected: bool = False
     submitted: bool = False
+    # Display and tagged text never change after creation, so each is formatted once on first use
+    _display_text: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _tagged_text: Optional[str] = field(default=None, init=False, repr=False, compare=False)
     
     def get_display_text(self):
-        source_tag = f"[{self.source}]"
-        return f"[{self.timestamp.strftime('%H:%M')}] {source_tag} {self.text}"
+        if self._display_text is None:
+            self._display_text = f"[{self.timestamp.strftime('%H:%M')}] {self.get_tagged_text()}"
+        return self._display_text
+
+    def get_tagged_text(self):
+        """Return the topic as "[SOURCE] text", the form used for submissions and prefixed copies."""
+        if self._tagged_text is None:
+            self._tagged_text = f"[{self.source}] {self.text}"
+        return self._tagged_text
 
 class UIController:
     """
@@ -44,24 +61,38 @@ class UIController:
         self.root = root
         self.app_controller = app_controller
         self.topics: List[Topic] = []
-        self.topic_queue = queue.Queue()
+        # Producers append from any thread and fire TOPIC_ADDED_EVENT; only the Tk thread pops.
+        # deque append/popleft are atomic, and nothing ever blocks on this queue, so no lock is needed.
+        self.topic_queue: deque = deque()
+        self._topic_drain_pending = False  # True while a TOPIC_ADDED_EVENT is queued but not yet handled
+        self._topic_events_stopped = False  # Set by stop_topic_events() once shutdown begins
         self.last_clicked_index = -1  # Track which topic was clicked last
+        # (display text, (bg, fg)) for each row currently in the listbox, used to diff renders
+        self._rendered_rows: List[Tuple[str, Tuple[str, str]]] = []
+        self._render_pending = False  # True while a render is scheduled with after_idle
+        self._suppress_listen_callback = False  # True while set_listening_state changes the Listen toggle
         
         # Initialize topic storage manager
         self.storage_manager = TopicStorageManager(TOPIC_STORAGE_FOLDER)
+        self._start_storage_writer()
+        # Clipboard copies run in order on one long-lived thread
+        self._clipboard_queue: queue.SimpleQueue = queue.SimpleQueue()
+        threading.Thread(target=self._clipboard_worker_loop, name="ClipboardCopy", daemon=True).start()
         
         # The View is created and managed by the controller
         self.view = UIView(root, self)
         self.view.listen_var.set(False)
         
-        self.processing = True
-        self.queue_thread = threading.Thread(target=self.process_topic_queue, daemon=True)
-        self.queue_thread.start()
+        # Topics are drained on the Tk thread when the producer signals, not by polling
+        self.root.bind(TOPIC_ADDED_EVENT, self._on_topic_added)
+        # Picks up anything queued before mainloop started, when event_generate had no loop to reach
+        self.root.after_idle(self._drain_topic_queue)
         
         # Initialize transcription method UI
         self.root.after(500, self.initialize_transcription_method_ui)  # Delay to allow transcription system to initialize
         
-        self.root.after(100, self.update_ui_loop)
+        # Redraw the list when the delete-submitted toggle changes how submitted topics look
+        self.view.delete_submitted_var.trace_add("write", lambda *args: self._schedule_render())
 
     def on_auto_submit_change(self, selected_mode: str):
         logger.info(f"UI Auto-Submit mode changed to: {selected_mode}")
@@ -131,14 +162,10 @@ class UIController:
             if current_method:
                 # Check if fallback is active by examining health status
                 health_status = get_transcription_health_status()
-                is_fallback = False
                 
                 # Simple heuristic: if we have multiple strategies and errors on the primary
-                if len(health_status) > 1:
-                    for strategy_name, status in health_status.items():
-                        if strategy_name == current_method and status.get("error_count", 0) > 0:
-                            is_fallback = True
-                            break
+                current_status = health_status.get(current_method, {})
+                is_fallback = len(health_status) > 1 and current_status.get("error_count", 0) > 0
                 
                 self.view.update_transcription_status(current_method, is_fallback)
             
@@ -146,40 +173,89 @@ class UIController:
             logger.error(f"Error updating transcription status display: {e}")
     
     def toggle_listening(self, *args):
+        if self._suppress_listen_callback:
+            return
         if self.view.listen_var.get():
             # Start audio monitoring and storage session
-            try:
-                storage_started = self.storage_manager.start_session()
-                if not storage_started:
-                    logger.warning("Failed to start storage session, but continuing with audio monitoring")
-            except Exception as e:
-                logger.error(f"Error starting storage session: {e}")
-            
+            self._storage_queue.put(self._start_storage_session)
             self.app_controller.start_listening()
         else:
             # Stop audio monitoring and end storage session
             self.app_controller.stop_listening()
-            try:
-                self.storage_manager.end_session()
-            except Exception as e:
-                logger.error(f"Error ending storage session: {e}")
+            self._storage_queue.put(self._end_storage_session)
+
+    def _start_storage_writer(self):
+        """
+        Start the thread that runs session starts/ends and topic writes in order, so a slow or
+        synced storage folder never stalls the Tk thread. close_storage() flushes and stops it.
+        """
+        self._storage_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._storage_closed = False
+        self._storage_thread = threading.Thread(target=self._storage_writer_loop, name="TopicStorageWriter", daemon=True)
+        self._storage_thread.start()
+
+    def _queue_store_topics(self, topics: List[Topic]):
+        self._storage_queue.put(lambda: self._store_topics(topics))
+
+    def close_storage(self):
+        """
+        Write out everything still pending, end the storage session and stop the writer thread.
+        Called once during application shutdown; later calls do nothing.
+        """
+        if self._storage_closed:
+            return
+        self._storage_closed = True
+
+        # Topics that arrived after the last drain are saved even though they never reach the list
+        pending = []
+        try:
+            while True:
+                pending.append(self.topic_queue.popleft())
+        except IndexError:
+            pass
+        if pending:
+            self._queue_store_topics(pending)
+
+        self._storage_queue.put(self._end_storage_session)
+        self._storage_queue.put(None)
+        self._storage_thread.join(timeout=STORAGE_SHUTDOWN_TIMEOUT_S)
+        if self._storage_thread.is_alive():
+            logger.error("Topic storage writer did not finish before shutdown; the session file may be incomplete.")
+
+    def _start_storage_session(self):
+        try:
+            storage_started = self.storage_manager.start_session()
+            if not storage_started:
+                logger.warning("Failed to start storage session, but continuing with audio monitoring")
+        except Exception as e:
+            logger.error(f"Error starting storage session: {e}")
+
+    def _end_storage_session(self):
+        try:
+            self.storage_manager.end_session()
+        except Exception as e:
+            logger.error(f"Error ending storage session: {e}")
+
+    def _storage_writer_loop(self):
+        """Runs storage tasks one at a time until close_storage enqueues a None sentinel."""
+        while True:
+            task = self._storage_queue.get()
+            if task is None:
+                break
+            task()
+        logger.info("Topic storage writer finished.")
     
     def set_listening_state(self, is_listening: bool):
         """
         Programmatically set the listening toggle state without triggering callbacks.
         Used during audio reconnection to reflect state changes.
         """
-        # Get all current traces and remove them temporarily
-        traces = self.view.listen_var.trace_info()
-        for trace in traces:
-            if trace[1] == "write":
-                self.view.listen_var.trace_remove("write", trace[2])
-        
-        # Set the value
-        self.view.listen_var.set(is_listening)
-        
-        # Re-add the trace
-        self.view.listen_var.trace_add("write", self.toggle_listening)
+        # Other write traces (e.g. the toggle switch's ON/OFF label) still run; only toggle_listening is skipped
+        self._suppress_listen_callback = True
+        try:
+            self.view.listen_var.set(is_listening)
+        finally:
+            self._suppress_listen_callback = False
 
     def request_new_ai_thread_ui(self):
         logger.info("UI 'New Thread' button clicked.")
@@ -223,16 +299,33 @@ class UIController:
         self.view.reconnect_var.set("Reconnect")
 
     def add_topic_to_queue(self, topic: Topic):
-        self.topic_queue.put(topic)
+        """Queue a topic from any thread and wake the Tk thread to drain it."""
+        self.topic_queue.append(topic)
+        # One wake-up per burst: topics queued before the drain runs ride along with it
+        if self._topic_drain_pending or self._topic_events_stopped:
+            return
+        self._topic_drain_pending = True
+        try:
+            self.root.event_generate(TOPIC_ADDED_EVENT, when="tail")
+        except (tk.TclError, RuntimeError):
+            # Mainloop isn't running yet (the startup drain picks it up) or the window is gone
+            # (close_storage saves what is left)
+            self._topic_drain_pending = False
     
+    def stop_topic_events(self):
+        """
+        Stop waking the Tk thread for new topics. Called at shutdown before the topic thread is
+        joined on the Tk thread, where an event_generate from that thread could block; topics
+        still queued are saved by close_storage().
+        """
+        self._topic_events_stopped = True
+
     def mark_topic_as_auto_submitted(self, topic: Topic):
         """Mark a topic as auto-submitted (will appear grayed out in UI)"""
-        # Find the topic in our list and mark it as submitted
-        for t in self.topics:
-            if t is topic:  # Use identity comparison since it's the same object
-                t.submitted = True
-                logger.info(f"Marked topic as auto-submitted: [{t.source}] {t.text[:50]}...")
-                break
+        # The list holds this same object, so there's no need to search for it; this also
+        # works before the topic has been drained from the queue into the list
+        topic.submitted = True
+        logger.info("Marked topic as auto-submitted: [%s] %.50s...", topic.source, topic.text)
     
     def unmark_failed_auto_submitted_topics(self, failed_topics: List[Topic]):
         """Unmark auto-submitted topics that failed so they can be retried"""
@@ -240,8 +333,9 @@ class UIController:
             for t in self.topics:
                 if t is failed_topic and t.submitted:  # Only unmark topics that were auto-submitted
                     t.submitted = False
-                    logger.info(f"Unmarked failed auto-submitted topic for retry: [{t.source}] {t.text[:50]}...")
+                    logger.info("Unmarked failed auto-submitted topic for retry: [%s] %.50s...", t.source, t.text)
                     break
+        self._schedule_render()
     
     def get_failed_auto_submitted_topics(self) -> List[Topic]:
         """Get topics that were auto-submitted but are now unmarked (failed)"""
@@ -249,74 +343,138 @@ class UIController:
         # They would be topics that are not submitted and not selected (since auto-submit doesn't select them)
         return [t for t in self.topics if not t.submitted and not t.selected]
 
-    def process_topic_queue(self):
-        while self.processing:
+    def _on_topic_added(self, event=None):
+        self._drain_topic_queue()
+
+    def _drain_topic_queue(self):
+        """Move pending topics from the queue into the topic list. Runs on the Tk thread."""
+        # Clear before popping so a topic appended mid-drain either gets popped here or fires a new event
+        self._topic_drain_pending = False
+        topics = []
+        try:
+            while len(topics) < TOPIC_DRAIN_BATCH_SIZE:
+                topics.append(self.topic_queue.popleft())
+        except IndexError:
+            pass
+        for topic in topics:
             try:
-                topic = self.topic_queue.get(timeout=0.1)
-                self.topics.append(topic)
-                
-                # Store topic to persistent storage
-                try:
-                    storage_success = self.storage_manager.store_topic(topic)
-                    if not storage_success:
-                        logger.warning(f"Failed to store topic to file: {topic.text[:50]}...")
-                except Exception as e:
-                    logger.error(f"Error storing topic to file: {e}")
-                
-                logger.info(f"Added new topic from {topic.source}: {topic.text[:50]}...")
-                self.topic_queue.task_done()
-            except queue.Empty:
-                pass
+                self._add_topic(topic)
             except Exception as e:
                 logger.error(f"Error processing topic queue: {e}")
+        if topics:
+            self._queue_store_topics(topics)
+            if len(self.topics) > MAX_TOPICS:
+                self._evict_oldest_topics()
+            self._schedule_render()
+        
+        # A full batch means more may be waiting; continue once pending UI events are handled
+        if len(topics) == TOPIC_DRAIN_BATCH_SIZE:
+            self.root.after_idle(self._drain_topic_queue)
+
+    def _add_topic(self, topic: Topic):
+        self.topics.append(topic)
+        # Runs once per topic; %-style args are only formatted if a handler takes the record
+        logger.info("Added new topic from %s: %.50s...", topic.source, topic.text)
+
+    def _evict_oldest_topics(self):
+        """Drop the oldest unselected topics once the list outgrows MAX_TOPICS."""
+        evict_count = len(self.topics) - (MAX_TOPICS - TOPIC_EVICTION_SLACK)
+        # Selected topics are kept so a pending submit or copy never loses them
+        evicted_ids = set()
+        for topic in self.topics:
+            if len(evicted_ids) == evict_count:
+                break
+            if not topic.selected:
+                evicted_ids.add(id(topic))
+        if not evicted_ids:
+            return
 
-    def update_ui_loop(self):
-        yview = self.view.topic_listbox.yview()
-        self.view.topic_listbox.delete(0, tk.END)
-        
-        for i, topic in enumerate(self.topics):
-            self.view.topic_listbox.insert(tk.END, topic.get_display_text())
-            
-            # Determine if we should show visual indication for submitted topics
-            show_submitted_indication = not self.get_delete_submitted_preference() and topic.submitted
-            
-            # Apply color based on selection state, last-clicked status, and submitted status
-            if i == self.last_clicked_index:
-                # Last clicked topic gets special highlighting
-                if topic.selected:
-                    # Last clicked + selected = darker blue
-                    bg_color = '#a0a0ff'
-                else:
-                    # Last clicked + deselected = very light blue
-                    bg_color = '#f0f0ff'
-                
-                # Apply submitted text color if needed
-                if show_submitted_indication:
-                    self.view.topic_listbox.itemconfig(i, {'bg': bg_color, 'fg': '#808080'})
-                else:
-                    self.view.topic_listbox.itemconfig(i, {'bg': bg_color})
-                    
-            elif topic.selected:
-                # Regular selected = normal blue
-                if show_submitted_indication:
-                    self.view.topic_listbox.itemconfig(i, {'bg': '#d0d0ff', 'fg': '#808080'})
-                else:
-                    self.view.topic_listbox.itemconfig(i, {'bg': '#d0d0ff'})
-            else:
-                # Deselected topics - apply submitted indication if needed
-                if show_submitted_indication:
-                    self.view.topic_listbox.itemconfig(i, {'fg': '#808080'})
-                # Otherwise use default white background and black text (no itemconfig needed)
-            
-            # Note: Removed selection_set calls to prevent overriding custom colors
-        
-        if self.view.topic_listbox.size() > 0 and yview != (0.0, 1.0):
-            try:
-                self.view.topic_listbox.yview_moveto(yview[0])
-            except tk.TclError:
-                pass
-        
-        self.root.after(100, self.update_ui_loop)
+        last_clicked_topic = self.topics[self.last_clicked_index] if 0 <= self.last_clicked_index < len(self.topics) else None
+        self.last_clicked_index = self._filter_topics(lambda t: id(t) not in evicted_ids, last_clicked_topic)
+        if last_clicked_topic is not None and self.last_clicked_index == -1:
+            # The topic shown in the full text pane is no longer in the list
+            self.clear_full_text_display()
+        logger.info(f"Topic list reached {MAX_TOPICS} entries; removed the {len(evicted_ids)} oldest unselected topics from the list.")
+
+    def _store_topics(self, topics: List[Topic]):
+        """Write a drained batch to persistent storage with one write and flush. Runs on the storage thread."""
+        try:
+            storage_success = self.storage_manager.store_topics(topics)
+            if not storage_success:
+                logger.warning(f"Failed to store {len(topics)} topic(s) to file: {topics[0].text[:50]}...")
+        except Exception as e:
+            logger.error(f"Error storing topics to file: {e}")
+
+    def _schedule_render(self):
+        """Redraw the topic list once the current burst of changes is done. Tk thread only."""
+        if self._render_pending:
+            return
+        self._render_pending = True
+        self.root.after_idle(self._render_scheduled)
+
+    def _render_scheduled(self):
+        self._render_pending = False
+        self._render_topics()
+
+    def _row_colors(self, i: int, topic: Topic, show_submitted_indication: bool) -> Tuple[str, str]:
+        """Return the (bg, fg) for a listbox row; an empty string means the listbox default."""
+        # Submitted topics are grayed out unless they're being deleted on submit
+        fg = '#808080' if show_submitted_indication and topic.submitted else ''
+        if i == self.last_clicked_index:
+            # Last clicked topic gets special highlighting: darker blue if selected, very light blue if not
+            bg = '#a0a0ff' if topic.selected else '#f0f0ff'
+        elif topic.selected:
+            # Regular selected = normal blue
+            bg = '#d0d0ff'
+        else:
+            bg = ''
+        return bg, fg
+
+    def _render_topics(self):
+        """Bring the listbox in line with self.topics, touching only the rows that changed."""
+        listbox = self.view.topic_listbox
+        show_submitted_indication = not self.get_delete_submitted_preference()
+        rows = [(topic.get_display_text(), self._row_colors(i, topic, show_submitted_indication))
+                for i, topic in enumerate(self.topics)]
+        rendered = self._rendered_rows
+
+        # Rows up to the first text mismatch stay in place; everything after it is re-inserted
+        first_changed = 0
+        common = min(len(rows), len(rendered))
+        while first_changed < common and rows[first_changed][0] == rendered[first_changed][0]:
+            first_changed += 1
+
+        self._apply_row_colors([(i, *rows[i][1]) for i in range(first_changed) if rows[i][1] != rendered[i][1]])
+
+        if first_changed < len(rendered):
+            # Rows were removed or replaced; keep the scroll position across the rebuild
+            yview = listbox.yview()
+            listbox.delete(first_changed, tk.END)
+            self._insert_rows(rows, first_changed)
+            if rows and yview != (0.0, 1.0):
+                try:
+                    listbox.yview_moveto(yview[0])
+                except tk.TclError:
+                    pass
+        elif first_changed < len(rows):
+            # Only new topics at the end; appending doesn't move the view
+            self._insert_rows(rows, first_changed)
+
+        self._rendered_rows = rows
+
+    def _insert_rows(self, rows: List[Tuple[str, Tuple[str, str]]], start: int):
+        listbox = self.view.topic_listbox
+        listbox.insert(tk.END, *(text for text, _colors in rows[start:]))
+        self._apply_row_colors([(i, *rows[i][1]) for i in range(start, len(rows)) if rows[i][1] != ('', '')])
+
+    def _apply_row_colors(self, changes: List[Tuple[int, str, str]]):
+        """Apply (index, bg, fg) row colors with one Tcl evaluation instead of an itemconfig call per row."""
+        if not changes:
+            return
+        listbox = self.view.topic_listbox
+        # Colors are '' or '#rrggbb'; braces keep an empty value as an argument that resets to the default
+        listbox.tk.eval("\n".join(f"{listbox} itemconfigure {i} -background {{{bg}}} -foreground {{{fg}}}"
+                                  for i, bg, fg in changes))
 
     def toggle_selection(self, event):
         try:
@@ -325,6 +483,10 @@ class UIController:
                 self.topics[idx].selected = not self.topics[idx].selected
                 self.last_clicked_index = idx  # Track which topic was clicked last
                 self._update_full_text_display(idx)
+                self._schedule_render()
+            # Selection is drawn with row colors; drop the listbox's native selection from the click
+            # so its highlight doesn't cover them (rows are no longer rebuilt on every tick)
+            self.view.topic_listbox.selection_clear(0, tk.END)
         except tk.TclError:
             pass
 
@@ -349,6 +511,7 @@ class UIController:
                 if self.last_clicked_index >= len(self.topics):
                     self.last_clicked_index = -1
                     self.clear_full_text_display()
+                self._schedule_render()
         except tk.TclError:
             pass
 
@@ -370,6 +533,7 @@ class UIController:
     def select_topics(self, select_all=True):
         for topic in self.topics:
             topic.selected = select_all
+        self._schedule_render()
         # Keep last clicked topic - its color will automatically adjust based on new selection state
         # (Dark blue for Select All, very light blue for Deselect All)
 
@@ -388,22 +552,38 @@ class UIController:
                 should_reset_last_clicked = True
         
         if selected_only:
-            self.topics = [t for t in self.topics if not t.selected]
+            last_clicked_new_index = self._filter_topics(lambda t: not t.selected, last_clicked_topic)
         else:
             self.topics = []
+            last_clicked_new_index = -1
         
         # Apply reset logic or adjust index
         if should_reset_last_clicked:
             self.last_clicked_index = -1
             self.clear_full_text_display()
         elif last_clicked_topic is not None:
-            # Find the new index of the last clicked topic
-            try:
-                self.last_clicked_index = self.topics.index(last_clicked_topic)
-            except ValueError:
+            self.last_clicked_index = last_clicked_new_index
+            if last_clicked_new_index == -1:
                 # Topic not found (shouldn't happen, but safety check)
-                self.last_clicked_index = -1
                 self.clear_full_text_display()
+        self._schedule_render()
+
+    def _filter_topics(self, keep: Callable[[Topic], bool], tracked: Optional[Topic]) -> int:
+        """
+        Keep only the topics for which keep() is true, in a single pass.
+
+        Returns the new index of the tracked topic, or -1 if it was removed or is None.
+        Matching is by identity, since two topics can compare equal field by field.
+        """
+        kept = []
+        tracked_index = -1
+        for topic in self.topics:
+            if keep(topic):
+                if topic is tracked:
+                    tracked_index = len(kept)
+                kept.append(topic)
+        self.topics = kept
+        return tracked_index
 
     def submit_selected_topics(self, select_all_override=False):
         context = self.view.context_text.get(1.0, tk.END).strip()
@@ -414,7 +594,7 @@ class UIController:
             return
 
         messages = [f"[CONTEXT] {context}"] if context else []
-        messages.extend([f"[{t.source}] {t.text}" for t in selected_topic_objects])
+        messages.extend(t.get_tagged_text() for t in selected_topic_objects)
         
         self.app_controller.submit_topics("\n".join(messages), selected_topic_objects)
         self.update_browser_status("info", f"Status: Submitted {len(selected_topic_objects)} topics...")
@@ -445,7 +625,7 @@ class UIController:
             return
 
         messages = [f"[CONTEXT] {context}"] if context else []
-        messages.extend([f"[{t.source}] {t.text}" for t in topics_to_submit])
+        messages.extend(t.get_tagged_text() for t in topics_to_submit)
         
         self.app_controller.submit_topics("\n".join(messages), topics_to_submit)
         self.update_browser_status("info", f"Status: Submitted {len(topics_to_submit)} topics from selected...")
@@ -453,7 +633,7 @@ class UIController:
     def _format_topic_for_copy(self, topic: Topic, keep_prefix: bool) -> str:
         """Format a topic for copying based on prefix preference."""
         if keep_prefix:
-            return f"[{topic.source}] {topic.text}"
+            return topic.get_tagged_text()
         else:
             return topic.text
 
@@ -468,11 +648,32 @@ class UIController:
         keep_prefix = self.view.get_keep_prefix_state()
         
         messages = [f"[CONTEXT] {context}"] if context else []
-        messages.extend([self._format_topic_for_copy(t, keep_prefix) for t in selected_topic_objects])
+        messages.extend(self._format_topic_for_copy(t, keep_prefix) for t in selected_topic_objects)
         
         consolidated_text = "\n".join(messages)
-        pyperclip.copy(consolidated_text)
-        self.update_browser_status("success", f"Status: Copied {len(selected_topic_objects)} topics to clipboard.")
+        # pyperclip retries while another app holds the clipboard, so copy off the Tk thread
+        self._clipboard_queue.put((consolidated_text, len(selected_topic_objects)))
+
+    def _clipboard_worker_loop(self):
+        """Runs clipboard copies one at a time; of the requests waiting, only the newest is copied."""
+        while True:
+            requests = [self._clipboard_queue.get()] + drain_queue(self._clipboard_queue)
+            # Older requests are superseded, so a slow copy can never overwrite a newer one
+            self._copy_to_clipboard(*requests[-1])
+
+    def _copy_to_clipboard(self, text: str, topic_count: int):
+        """Copy text to the clipboard on the clipboard thread, then report the result on the Tk thread."""
+        try:
+            pyperclip.copy(text)
+            status = ("success", f"Status: Copied {topic_count} topics to clipboard.")
+        except Exception as e:
+            logger.error(f"Error copying topics to clipboard: {e}")
+            status = ("error", "Status: Failed to copy topics to clipboard.")
+        try:
+            self.root.after(0, self.update_browser_status, *status)
+        except (tk.TclError, RuntimeError):
+            # Window was destroyed while the copy was running
+            pass
 
     def copy_all_topics(self):
         self.copy_selected_topics(select_all_override=True)
@@ -509,26 +710,22 @@ class UIController:
                     should_reset_last_clicked = last_clicked_topic.selected
             
             # Remove submitted topics
-            self.topics = [t for t in self.topics if id(t) not in submitted_ids]
+            last_clicked_new_index = self._filter_topics(lambda t: id(t) not in submitted_ids, last_clicked_topic)
             
             # Apply reset logic or adjust index
             if should_reset_last_clicked:
                 self.last_clicked_index = -1
                 self.clear_full_text_display()
             elif last_clicked_topic is not None and id(last_clicked_topic) not in submitted_ids:
-                # Find the new index of the last clicked topic (if it wasn't submitted)
-                try:
-                    self.last_clicked_index = self.topics.index(last_clicked_topic)
-                except ValueError:
-                    # Topic not found (shouldn't happen, but safety check)
-                    self.last_clicked_index = -1
-                    self.clear_full_text_display()
+                # The last clicked topic wasn't submitted, so it kept its place in the filtered list
+                self.last_clicked_index = last_clicked_new_index
             elif self.last_clicked_index >= len(self.topics):
                 # Index out of bounds
                 self.last_clicked_index = -1
                 self.clear_full_text_display()
             
             logger.info(f"Cleared {len(submitted_topics)} submitted topics from UI.")
+        self._schedule_render()
 
     def clear_full_text_display(self):
         self.view.full_text.config(state="normal")
@@ -537,21 +734,11 @@ class UIController:
 
     def update_browser_status(self, status_key: str, custom_message: Optional[str] = None):
         self.view.update_browser_status(status_key, custom_message)
-        level = "warning" if status_key in ["error", "browser_human_verification", "warning", "browser_input_unavailable"] else "info"
-        logger.log(logging.getLevelName(level.upper()), f"UI Status Update ({status_key}): {custom_message or self.view.status_colors.get(status_key, (None, ''))[1]}")
+        level = logging.WARNING if status_key in _WARNING_STATUS_KEYS else logging.INFO
+        if logger.isEnabledFor(level):
+            message = custom_message or self.view.status_colors.get(status_key, (None, ''))[1]
+            logger.log(level, f"UI Status Update ({status_key}): {message}")
 
     def get_delete_submitted_preference(self) -> bool:
         """Return the current state of the delete submitted checkbox."""
-        return self.view.delete_submitted_var.get()
-
-    def on_closing(self):
-        logger.info("UIController: on_closing called.")
-        self.processing = False
-        
-        # Ensure storage session is properly closed
-        try:
-            self.storage_manager.end_session()
-        except Exception as e:
-            logger.error(f"Error closing storage session during shutdown: {e}")
-        
-        self.app_controller.on_closing_ui_initiated()
\ No newline at end of file
+        return self.view.delete_submitted_var.get()
\ No newline at end of file
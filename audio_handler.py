@@ -2,11 +2,12 @@
 import pyaudiowpatch as pyaudio
 import numpy as np
 import time
+import threading
 from datetime import datetime
-import io
-import wave
+import struct
 import queue
 import logging
+from collections import deque
 from typing import List, Dict, Any, Optional
 from config import SAMPLE_RATE, CHUNK_SIZE, FORMAT, CHANNELS, SILENCE_THRESHOLD, SILENCE_DURATION, MAX_RECORDING_DURATION
 from audio_device_utils import get_default_microphone_info, get_default_speakers_loopback_info, validate_device_info, format_device_info
@@ -16,6 +17,13 @@ logger = logging.getLogger(__name__)
 
 # Calculate frames needed for silence duration
 FRAMES_PER_BUFFER = int(SAMPLE_RATE * SILENCE_DURATION / CHUNK_SIZE)
+# Pre-roll kept before the trigger and loud run needed to start recording, as durations so they
+# hold when CHUNK_SIZE changes (10 and 2 chunks at the default 1024)
+PRE_ROLL_CHUNKS = max(2, round(0.23 * SAMPLE_RATE / CHUNK_SIZE))
+SOUND_TRIGGER_CHUNKS = max(2, round(0.046 * SAMPLE_RATE / CHUNK_SIZE))
+
+# Per-recorder-thread scratch array reused by get_audio_level for every chunk
+_level_scratch = threading.local()
 
 class AudioSegment:
     """Class to store audio data in memory"""
@@ -27,17 +35,28 @@ class AudioSegment:
         self.timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         self.source = source  # "ME" or "OTHERS" to identify the microphone source
     
+    def _build_wav_bytes(self, channels: int) -> bytes:
+        """
+        Build a PCM WAV file from the frames with a single allocation.
+        
+        The 44-byte canonical header is packed directly and joined with the frames,
+        instead of joining the frames, copying them into a wave.Wave_write buffer
+        and reading that buffer back out.
+        """
+        data_size = sum(len(frame) for frame in self.frames)
+        block_align = channels * self.sample_width
+        header = struct.pack(
+            '<4sI4s4sIHHIIHH4sI',
+            b'RIFF', 36 + data_size, b'WAVE',
+            b'fmt ', 16, 1, channels, self.sample_rate, self.sample_rate * block_align, block_align, self.sample_width * 8,
+            b'data', data_size
+        )
+        return b''.join([header, *self.frames])
+    
     def get_wav_bytes(self) -> bytes:
-        """Convert frames to WAV file bytes in memory using context managers"""
-        wav_buffer = io.BytesIO()
+        """Convert frames to WAV file bytes in memory"""
         try:
-            with wave.open(wav_buffer, 'wb') as wf:
-                wf.setnchannels(self.channels)
-                wf.setsampwidth(self.sample_width)
-                wf.setframerate(self.sample_rate)
-                wf.writeframes(b''.join(self.frames))
-            wav_buffer.seek(0)
-            return wav_buffer.read()
+            return self._build_wav_bytes(self.channels)
         except Exception as e:
             logger.error(f"Error creating WAV data: {e}")
             # Return empty bytes if there's an error
@@ -48,17 +67,10 @@ class AudioSegment:
         Get WAV bytes optimized for API transmission
         Ensures format compatibility with API requirements
         """
-        wav_buffer = io.BytesIO()
         try:
-            with wave.open(wav_buffer, 'wb') as wf:
-                # Ensure standard format for API compatibility
-                # Most APIs prefer 16-bit PCM, mono or stereo
-                wf.setnchannels(min(self.channels, 2))  # Limit to stereo max
-                wf.setsampwidth(self.sample_width)
-                wf.setframerate(self.sample_rate)
-                wf.writeframes(b''.join(self.frames))
-            wav_buffer.seek(0)
-            return wav_buffer.read()
+            # Ensure standard format for API compatibility
+            # Most APIs prefer 16-bit PCM, mono or stereo
+            return self._build_wav_bytes(min(self.channels, 2))  # Limit to stereo max
         except Exception as e:
             logger.error(f"Error creating API-compatible WAV data: {e}")
             return b''
@@ -121,10 +133,22 @@ class AudioSegment:
 def get_audio_level(data: bytes) -> float:
     """Calculate the audio level using absolute values"""
     data_np = np.frombuffer(data, dtype=np.int16)
-    return np.mean(np.abs(data_np))
+    if data_np.size == 0:
+        return 0.0
+    scratch = getattr(_level_scratch, "buffer", None)
+    if scratch is None or scratch.size < data_np.size:
+        scratch = _level_scratch.buffer = np.empty(data_np.size, dtype=np.int32)
+    # Widen into the reused int32 buffer: no per-chunk allocation, and abs(-32768)
+    # doesn't wrap around as it does in int16
+    values = scratch[:data_np.size]
+    np.copyto(values, data_np)
+    np.abs(values, out=values)
+    # Integer sum then one division; mean() would convert every element to float64.
+    # An int32 sum of |int16| values can't overflow for chunks under 65536 samples.
+    return int(np.add.reduce(values)) / values.size
 
 def process_recording(frames: List[bytes], source: str, audio: pyaudio.PyAudio, 
-                     audio_queue: queue.Queue, device_info: Dict[str, Any] = None, exception_notifier=None) -> None:
+                     audio_queue: queue.SimpleQueue, device_info: Dict[str, Any] = None, exception_notifier=None) -> None:
     """Process the recorded frames and add to in-memory queue"""
     if not frames:
         logger.warning(f"No frames to process for {source}")
@@ -186,26 +210,26 @@ def _wait_for_sound(stream, source: str, run_threads_ref: Dict[str, bool], audio
     """
     logger.debug(f"Waiting for sound on {source} microphone...")
     sound_counter = 0
-    recent_chunks = []  # Rolling buffer to capture audio before detection
-    max_buffer_size = 10  # Keep last 10 chunks (~230ms of audio)
+    # Rolling buffer of the last ~230ms before detection; maxlen drops the oldest chunk in O(1)
+    recent_chunks = deque(maxlen=PRE_ROLL_CHUNKS)
     
     while run_threads_ref["active"] and run_threads_ref.get("listening", True):
         try:
+            # PyAudio drops the GIL inside Pa_ReadStream, so the ME and OTHERS recorders
+            # block on their devices in parallel and don't stall the transcriber.
             data = stream.read(CHUNK_SIZE, exception_on_overflow=False)
             level = get_audio_level(data)
             
             # Maintain rolling buffer of recent chunks
             recent_chunks.append(data)
-            if len(recent_chunks) > max_buffer_size:
-                recent_chunks.pop(0)
             
             if level > SILENCE_THRESHOLD:
                 sound_counter += 1
-                if sound_counter >= 2:  # Require at least 2 consecutive sound frames
+                if sound_counter >= SOUND_TRIGGER_CHUNKS:  # Require ~46ms of consecutive sound
                     logger.info(f"Sound detected on {source} microphone. Recording started.")
                     # Return all chunks that should be included in the recording
                     # This includes the buffer chunks plus the current triggering chunk
-                    return recent_chunks.copy()
+                    return list(recent_chunks)
             else:
                 sound_counter = 0  # Reset counter if we detect silence
         except Exception as e:
@@ -282,7 +306,7 @@ def _record_until_silence(
 
 
 def recording_thread(source: str, mic_data: Dict[str, Dict[str, Any]], 
-                    audio_queue: queue.Queue, service_manager, 
+                    audio_queue: queue.SimpleQueue, service_manager, 
                     run_threads_ref: Dict[str, bool], audio_monitor=None, exception_notifier=None) -> None:
     """
     Generic thread for handling audio recording from a specific microphone.
@@ -378,7 +402,12 @@ def recording_thread(source: str, mic_data: Dict[str, Dict[str, Any]],
     try:
         while run_threads_ref["active"]:
             if not run_threads_ref.get("listening", True):
-                time.sleep(0.1)
+                listen_event = run_threads_ref.get("listen_event")
+                if listen_event is not None:
+                    # Blocks with no wake-ups until listening starts or shutdown sets it
+                    listen_event.wait()
+                else:
+                    time.sleep(0.1)
                 continue
             
             # Check if stream is still valid, recreate if needed
@@ -428,7 +457,7 @@ def recording_thread(source: str, mic_data: Dict[str, Dict[str, Any]],
                 continue
 
             mic["recording"] = True
-            mic["frames"] = initial_chunks.copy()  # Start with all the initial chunks
+            mic["frames"] = initial_chunks  # Start with all the initial chunks (already a fresh list)
             consecutive_silence_required = FRAMES_PER_BUFFER
 
             # 2. Record until silence or max duration
@@ -1,6 +1,6 @@
 # browser.py
 import os
-import glob
+import functools
 import logging
 import time
 import threading
@@ -16,6 +16,7 @@ from config import DEBUGGER_ADDRESS, ENABLE_SCREENSHOTS, SCREENSHOT_FOLDER
 from chat_page import ChatPage, SUBMISSION_SUCCESS, SUBMISSION_FAILED_INPUT_UNAVAILABLE, SUBMISSION_FAILED_HUMAN_VERIFICATION_DETECTED, SUBMISSION_FAILED_OTHER
 from connection_monitor import ConnectionMonitor, ConnectionState
 from reconnection_manager import ReconnectionManager
+from queue_utils import drain_queue
 
 # Configure logger for this module
 logger = logging.getLogger(__name__)
@@ -34,7 +35,8 @@ class BrowserManager:
         self.chat_config = chat_config
         self.ui_update_callback = ui_update_callback
         self.status_callback = status_callback
-        self.browser_queue = queue.Queue()
+        # Nothing joins on this queue, so the lighter SimpleQueue (no task_done bookkeeping) suffices
+        self.browser_queue = queue.SimpleQueue()
         self.run_threads_ref = {"active": False}
         self.comm_thread: Optional[threading.Thread] = None
         self.connection_monitor: Optional[ConnectionMonitor] = None
@@ -165,12 +167,13 @@ class BrowserManager:
         """Gets a list of new screenshot files since the last check."""
         if not os.path.exists(screenshot_folder): return []
         try:
-            image_extensions = ['*.png', '*.jpg', '*.jpeg']
-            all_files = []
-            for ext in image_extensions:
-                all_files.extend(glob.glob(os.path.join(screenshot_folder, ext)))
-            
-            new_files = [os.path.abspath(f) for f in all_files if os.path.getmtime(f) > last_check_time.timestamp()]
+            image_extensions = ('.png', '.jpg', '.jpeg')
+            last_check_ts = last_check_time.timestamp()
+            # One directory pass; on Windows DirEntry.stat() is served from the listing without a syscall per file
+            with os.scandir(screenshot_folder) as entries:
+                new_files = [os.path.abspath(entry.path) for entry in entries
+                             if entry.name.lower().endswith(image_extensions) and entry.is_file()
+                             and entry.stat().st_mtime > last_check_ts]
             if new_files: logger.info(f"Found {len(new_files)} new screenshots.")
             return new_files
         except Exception as e:
@@ -233,7 +236,7 @@ class BrowserManager:
             logger.info("Stopping browser communication thread...")
             self.run_threads_ref["active"] = False
             if self.comm_thread and self.comm_thread.is_alive():
-                self.comm_thread.join(timeout=5)
+                self.comm_thread.join(timeout=1.0)
             self.comm_thread = None
             logger.info("Browser communication thread shut down.")
 
@@ -245,7 +248,7 @@ class BrowserManager:
         while self.run_threads_ref["active"]:
             try:
                 # Block until at least one item is in the queue
-                first_item = self.browser_queue.get(timeout=1.0)
+                first_item = self.browser_queue.get(timeout=0.5)
             except queue.Empty:
                 continue
 
@@ -258,7 +261,6 @@ class BrowserManager:
                 # 0. Check if we're in a disconnected state and skip processing
                 if self.connection_monitor and self.connection_monitor.get_connection_state() == ConnectionState.DISCONNECTED:
                     logger.info("Connection is disconnected - skipping batch processing to allow reconnection.")
-                    # Don't call task_done here - let the finally block handle it
                     continue
                 
                 # 0.1. Validate connection health before proceeding (only if connected)
@@ -268,13 +270,11 @@ class BrowserManager:
                             logger.warning("Connection health check failed - skipping batch to allow reconnection.")
                             # Treat health check failure as a connection error to trigger recovery
                             self.connection_monitor._handle_connection_loss()
-                            # Don't call task_done here - let the finally block handle it
                             continue
                     except Exception as e:
                         if self.connection_monitor and self.connection_monitor.is_connection_error(e):
                             logger.warning(f"Connection health check detected connection error: {e}")
                             # Connection error will be handled by connection monitor, skip this batch
-                            # Don't call task_done here - let the finally block handle it
                             continue
                         else:
                             logger.warning(f"Connection health check error (non-connection): {e}")
@@ -286,18 +286,13 @@ class BrowserManager:
                     if self.connection_monitor and self.connection_monitor.is_connection_error(e):
                         logger.error(f"Connection error during focus browser window: {e}")
                         # Connection error will be handled by connection monitor, skip this batch
-                        # Don't call task_done here - let the finally block handle it
                         continue
                     else:
                         # Non-connection error, log but continue
                         logger.warning(f"Non-connection error during focus browser window: {e}")
                 
                 # 2. Drain the queue to get all available items
-                while not self.browser_queue.empty():
-                    try:
-                        all_items_in_batch.append(self.browser_queue.get_nowait())
-                    except queue.Empty:
-                        break
+                all_items_in_batch.extend(drain_queue(self.browser_queue))
 
                 # 3. Filter out wake-up items early to determine if we need to prime
                 real_items = [item for item in all_items_in_batch if not item.get('_wake_up', False)]
@@ -326,17 +321,14 @@ class BrowserManager:
                         
                     if not prime_success:
                         logger.error("Could not prime input field. Skipping batch.")
-                        # Don't call task_done here - let the finally block handle it
                         continue
                 except Exception as e:
                     if self.connection_monitor and self.connection_monitor.is_connection_error(e):
                         logger.error(f"Connection error during prime input: {e}")
                         # Connection error will be handled by connection monitor, skip this batch
-                        # Don't call task_done here - let the finally block handle it
                         continue
                     else:
                         logger.error(f"Non-connection error during prime input: {e}")
-                        # Don't call task_done here - let the finally block handle it
                         continue
 
                 # 5. Wait for the site to be ready for submission
@@ -360,7 +352,6 @@ class BrowserManager:
                         if self.connection_monitor and self.connection_monitor.is_connection_error(e):
                             logger.warning(f"Connection error during ready check: {e}")
                             # Connection error will be handled by connection monitor, skip this batch
-                            # Don't call task_done here - let the finally block handle it
                             # Use a flag to indicate we should skip the rest of the processing
                             is_ready = None  # Use None to indicate connection error vs timeout
                             break
@@ -377,7 +368,6 @@ class BrowserManager:
                 elif not is_ready:
                     logger.error("Timed out waiting for submit button. Aborting batch.")
                     self.ui_update_callback(SUBMISSION_FAILED_INPUT_UNAVAILABLE, [])
-                    # Don't call task_done here - let the finally block handle it
                     continue
 
                 logger.info("Submit button is now active. Browser is ready.")
@@ -394,7 +384,15 @@ class BrowserManager:
                 except Exception as e:
                     logger.warning(f"Screenshot upload failed due to connection error: {e}")
 
-                # 7. Construct final payload and submit
+                # 7. Pick up anything queued while priming/waiting so a burst of auto-submits
+                # goes out as one message instead of another full prime-and-wait cycle
+                late_items = drain_queue(self.browser_queue)
+                if late_items:
+                    all_items_in_batch.extend(late_items)
+                    real_items.extend(item for item in late_items if not item.get('_wake_up', False))
+                    logger.info(f"Merged {len(late_items)} items queued during submit preparation into this batch.")
+
+                # 8. Construct final payload and submit
                 logger.info(f"Processing a batch of {len(real_items)} real items (plus {len(wake_up_items)} wake-up items).")
                 
                 message_prompt = self.chat_config.get("prompt_message_content", "").strip()
@@ -433,9 +431,6 @@ class BrowserManager:
             except Exception as e:
                 logger.error(f"Failed to process and submit batch: {e}", exc_info=True)
                 self.ui_update_callback(SUBMISSION_FAILED_OTHER, [])
-            finally:
-                for _ in all_items_in_batch:
-                    self.browser_queue.task_done()
 
         logger.info("Browser communication loop has exited.")
 
@@ -521,8 +516,20 @@ class BrowserManager:
         return queue_size
 
 # Standalone utility function
+@functools.lru_cache(maxsize=8)
+def _read_prompt_file(file_path: str, mtime: float) -> str:
+    """Reads a prompt file; mtime is part of the cache key so edits are picked up without a restart."""
+    with open(file_path, "rb") as f:
+        raw = f.read()
+    try:
+        return raw.decode("utf-8").strip()
+    except UnicodeDecodeError:
+        # Files saved by older Windows editors are often cp1252; decode the bytes already read
+        logger.warning(f"Prompt file '{file_path}' is not valid UTF-8, decoding as cp1252.")
+        return raw.decode("cp1252", errors="replace").strip()
+
 def load_single_chat_prompt(chat_name: str, chat_config: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-    """Loads prompt files for a single chat configuration."""
+    """Loads prompt files for a single chat configuration, re-reading a file only when its mtime changes."""
     if not chat_config:
         logger.error(f"No configuration provided for '{chat_name}' to load prompts.")
         return None
@@ -533,10 +540,9 @@ def load_single_chat_prompt(chat_name: str, chat_config: Dict[str, Any]) -> Opti
         file_path = updated_config.get(key)
         if file_path:
             try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    content = f.read().strip()
+                content = _read_prompt_file(file_path, os.path.getmtime(file_path))
                 updated_config[config_key] = content
-                logger.info(f"Loaded prompt for {chat_name} from {file_path} ({len(content)} chars)")
+                logger.debug(f"Loaded prompt for {chat_name} from {file_path} ({len(content)} chars)")
             except FileNotFoundError:
                 logger.error(f"CRITICAL: Prompt file '{file_path}' not found for {chat_name}.")
                 return None
@@ -544,4 +550,4 @@ def load_single_chat_prompt(chat_name: str, chat_config: Dict[str, Any]) -> Opti
                 logger.error(f"Error loading prompt file '{file_path}': {e}")
                 return None
             
-    return updated_config
\ No newline at end of file
+    return updated_config
@@ -26,7 +26,7 @@ FRAMES_PER_BUFFER = int(SAMPLE_RATE * SILENCE_DURATION / CHUNK_SIZE)  # Calculat
 # Whisper model configuration
 MODELS_FOLDER = "faster_whisper_models"  # Folder to save faster_whisper models
 WHISPER_MODEL = "large-v3"  # Whisper model size (tiny, base, small, medium, large-v1, large-v2)
-COMPUTE_TYPE = "float16"  # Compute type (float16, int8)
+COMPUTE_TYPE = "int8_float16"  # Compute type on CUDA (float16, int8_float16, int8); int8_float16 = INT8 weights, FP16 activations
 LANGUAGE = "en"        # Set to English only
 BEAM_SIZE = 5          # Beam size for faster-whisper
 
@@ -122,11 +122,11 @@ def is_groq_api_available():
     return api_key is not None and len(api_key.strip()) > 0
 
 def is_pytorch_available():
-    """Check if PyTorch is available"""
+    """Check if PyTorch is installed without importing it (importing loads the CUDA runtime)"""
+    import importlib.util
     try:
-        import torch
-        return True
-    except ImportError:
+        return importlib.util.find_spec("torch") is not None
+    except (ImportError, ValueError):
         return False
 
 def is_faster_whisper_available():
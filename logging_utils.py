@@ -0,0 +1,41 @@
+# logging_utils.py
+import atexit
+import logging
+import logging.handlers
+import queue
+
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+
+def setup_logging(log_file_path: str = "transcription.log", level: int = logging.INFO) -> logging.handlers.QueueListener:
+    """
+    Route all log records through a queue so that worker threads and the Tk thread
+    only enqueue; a single listener thread owns the file and console handlers.
+    """
+    formatter = logging.Formatter(LOG_FORMAT)
+    # Keep today's log plus one backup; a log left over from an earlier day is rolled over on the
+    # first write. delay=True defers opening the file until the listener writes the first record.
+    file_handler = logging.handlers.TimedRotatingFileHandler(log_file_path, when="midnight", backupCount=1, delay=True)
+    output_handlers = [file_handler, logging.StreamHandler()]
+    for handler in output_handlers:
+        handler.setFormatter(formatter)
+
+    log_queue = queue.SimpleQueue()
+    # QueueHandler.prepare() formats the record before queuing it; with the bare message format
+    # only args are merged, and the listener's handlers apply LOG_FORMAT exactly once
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
+
+    # Replace any handlers already on the root logger, so records are never written twice
+    root_logger = logging.getLogger()
+    for handler in root_logger.handlers[:]:
+        root_logger.removeHandler(handler)
+        handler.close()
+    root_logger.addHandler(queue_handler)
+    root_logger.setLevel(level)
+
+    listener = logging.handlers.QueueListener(log_queue, *output_handlers, respect_handler_level=True)
+    listener.start()
+    # Flush records still queued when the interpreter exits
+    atexit.register(listener.stop)
+    return listener
@@ -1,6 +1,7 @@
 # managers.py
 import logging
 import threading
+import time
 import pyaudiowpatch as pyaudio
 from typing import Dict, Any, Optional
 
@@ -12,10 +13,18 @@ from config import CHAT, CHATS
 
 logger = logging.getLogger(__name__)
 
+# Total time budget for joining all service threads on shutdown
+SHUTDOWN_JOIN_TIMEOUT = 2.0
+
+# Chat config keys holding loaded prompt content
+PROMPT_CONTENT_KEYS = ("prompt_initial_content", "prompt_message_content")
+
 class StateManager:
     """Manages the shared state of the application."""
     def __init__(self):
-        self.run_threads_ref = {"active": True, "listening": False}
+        # Set while listening or shutting down; recorders block on it instead of polling when paused
+        self.listen_event = threading.Event()
+        self.run_threads_ref = {"active": True, "listening": False, "listen_event": self.listen_event}
         self.auto_submit_mode = "Off"
 
     def is_active(self) -> bool:
@@ -27,10 +36,12 @@ class StateManager:
     def start_listening(self):
         logger.info("Starting microphone listening")
         self.run_threads_ref["listening"] = True
+        self.listen_event.set()
 
     def stop_listening(self):
         logger.info("Stopping microphone listening")
         self.run_threads_ref["listening"] = False
+        self.listen_event.clear()
 
     def set_auto_submit_mode(self, mode: str):
         if mode in ["Off", "Others", "All"]:
@@ -43,6 +54,8 @@ class StateManager:
         logger.info("StateManager shutting down.")
         self.run_threads_ref["active"] = False
         self.run_threads_ref["listening"] = False
+        # Release recorders blocked waiting for listening to start
+        self.listen_event.set()
 
 class ServiceManager:
     """
@@ -56,6 +69,7 @@ class ServiceManager:
         self.browser_manager: Optional[BrowserManager] = None
         self.audio_monitor: Optional[AudioMonitor] = None
         self.threads = []
+        self.audio_queue = None  # Set by start_services; used to wake the transcriber on shutdown
         self.mic_data = {
             "ME": {"device_info": None, "stream": None},
             "OTHERS": {"device_info": None, "stream": None}
@@ -111,14 +125,9 @@ class ServiceManager:
         try:
             self.ui_controller.update_browser_status("info", "Status: Connecting to browser...")
             active_chat_name = CHAT
-            base_chat_config = CHATS.get(active_chat_name)
-            if not base_chat_config:
-                logger.error(f"CRITICAL: No configuration for chat '{active_chat_name}'.")
-                self.ui_controller.update_browser_status("error", f"Status: No config for {active_chat_name}.")
-                return False
-
-            loaded_config = load_single_chat_prompt(active_chat_name, base_chat_config)
+            loaded_config = self.get_active_chat_config()
             if not loaded_config:
+                logger.error(f"CRITICAL: Could not load configuration for chat '{active_chat_name}'.")
                 self.ui_controller.update_browser_status("error", f"Status: Config load error for {active_chat_name}.")
                 return False
 
@@ -155,11 +164,40 @@ class ServiceManager:
             self.ui_controller.update_browser_status("error", "Status: Browser initialization error.")
             return False
 
+    def get_active_chat_config(self) -> Optional[Dict[str, Any]]:
+        """
+        Return the active chat config with its prompts loaded.
+        
+        Prompt contents are cached per file in load_single_chat_prompt and only
+        re-read when the file's modification time changes.
+        """
+        base_chat_config = CHATS.get(CHAT)
+        if not base_chat_config:
+            logger.error(f"No configuration for chat '{CHAT}'.")
+            return None
+        return load_single_chat_prompt(CHAT, base_chat_config)
+
+    def refresh_browser_prompts(self):
+        """Push edited prompt files into the running browser manager without touching its runtime state."""
+        if not self.browser_manager:
+            return
+        loaded_config = self.get_active_chat_config()
+        if not loaded_config:
+            return
+        # Build a new dict and swap it in with one assignment, so the browser thread never sees
+        # the config while its prompts are being replaced
+        chat_config = dict(self.browser_manager.chat_config)
+        for key in PROMPT_CONTENT_KEYS:
+            if key in loaded_config:
+                chat_config[key] = loaded_config[key]
+        self.browser_manager.chat_config = chat_config
+
     def start_services(self, audio_queue, transcribed_topics_queue) -> bool:
         if not self.audio:
             logger.error("PyAudio not initialized. Cannot start services.")
             return False
 
+        self.audio_queue = audio_queue
         for source in ["ME", "OTHERS"]:
             thread = threading.Thread(
                 name=f"Recorder{source}",
@@ -193,9 +231,19 @@ class ServiceManager:
         if self.browser_manager:
             self.browser_manager.stop_communication_thread()
 
+        # Wake the transcriber immediately instead of waiting out its queue timeout
+        if self.audio_queue is not None:
+            self.audio_queue.put(None)
+
+        # All service threads watch the same run flag and wind down in parallel,
+        # so join them against one shared deadline instead of one timeout each.
+        # Their blocking reads time out within ~0.5s, so a short budget is enough.
+        deadline = time.monotonic() + SHUTDOWN_JOIN_TIMEOUT
         for thread in self.threads:
             if thread.is_alive():
-                thread.join(timeout=5)
+                thread.join(timeout=max(0.0, deadline - time.monotonic()))
+                if thread.is_alive():
+                    logger.warning(f"Thread {thread.name} did not stop within the shutdown timeout.")
 
         if self.audio:
             self.audio.terminate()
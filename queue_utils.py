@@ -0,0 +1,26 @@
+# queue_utils.py
+import queue
+from typing import Any, List, Optional, Union
+
+
+def drain_queue(q: Union[queue.Queue, queue.SimpleQueue], max_items: Optional[int] = None) -> List[Any]:
+    """
+    Pull pending items off a queue without blocking.
+
+    Relies on get_nowait() raising queue.Empty rather than checking empty()
+    first, which is racy with concurrent producers.
+
+    Args:
+        q: Queue to drain
+        max_items: Upper bound on items returned, or None to drain everything
+
+    Returns:
+        List of items in FIFO order (possibly empty)
+    """
+    items = []
+    try:
+        while max_items is None or len(items) < max_items:
+            items.append(q.get_nowait())
+    except queue.Empty:
+        pass
+    return items
@@ -0,0 +1,81 @@
+# test_logging_utils.py
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import unittest
+import atexit
+import logging
+import tempfile
+import shutil
+
+from logging_utils import setup_logging
+
+class TestSetupLogging(unittest.TestCase):
+    """Tests for the queue-based logging setup."""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.log_path = os.path.join(self.test_dir, "test.log")
+        root_logger = logging.getLogger()
+        self.saved_handlers = root_logger.handlers[:]
+        self.saved_level = root_logger.level
+        self.listener = None
+        self.listener_stopped = False
+
+    def tearDown(self):
+        root_logger = logging.getLogger()
+        if self.listener:
+            # setup_logging registers stop() to run at exit; it must not run twice
+            atexit.unregister(self.listener.stop)
+            if not self.listener_stopped:
+                self.listener.stop()
+            for handler in self.listener.handlers:
+                handler.close()
+        for handler in root_logger.handlers[:]:
+            root_logger.removeHandler(handler)
+        for handler in self.saved_handlers:
+            root_logger.addHandler(handler)
+        root_logger.setLevel(self.saved_level)
+        shutil.rmtree(self.test_dir)
+
+    def _read_log_lines(self):
+        # Stopping the listener flushes every queued record to the file
+        self.listener.stop()
+        self.listener_stopped = True
+        with open(self.log_path, 'r') as f:
+            return f.read().splitlines()
+
+    def test_record_is_formatted_once(self):
+        """A record reaches the file as a single formatted line, with args merged."""
+        self.listener = setup_logging(self.log_path)
+
+        logging.getLogger("foo").warning("hello %s", "world")
+
+        lines = self._read_log_lines()
+        self.assertEqual(len(lines), 1)
+        self.assertTrue(lines[0].endswith(" - foo - WARNING - hello world"), lines[0])
+        self.assertNotIn("WARNING:foo", lines[0])
+
+    def test_exception_traceback_written_once(self):
+        """A logged exception's traceback appears once in the file."""
+        self.listener = setup_logging(self.log_path)
+
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logging.getLogger("foo").exception("failed")
+
+        with_traceback = "\n".join(self._read_log_lines())
+        self.assertEqual(with_traceback.count("ValueError: boom"), 1)
+
+    def test_replaces_existing_root_handlers(self):
+        """Handlers already on the root logger are replaced by the single queue handler."""
+        logging.getLogger().addHandler(logging.NullHandler())
+
+        self.listener = setup_logging(self.log_path)
+
+        self.assertEqual(len(logging.getLogger().handlers), 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,38 @@
+# test_queue_utils.py
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import unittest
+import queue
+
+from queue_utils import drain_queue
+
+class TestDrainQueue(unittest.TestCase):
+    """Unit tests for drain_queue helper."""
+    
+    def test_empty_queue_returns_empty_list(self):
+        """Draining an empty queue returns an empty list without blocking."""
+        self.assertEqual(drain_queue(queue.Queue()), [])
+    
+    def test_drains_all_items_in_order(self):
+        """Without a limit every pending item is returned in FIFO order."""
+        q = queue.Queue()
+        for i in range(5):
+            q.put(i)
+        
+        self.assertEqual(drain_queue(q), [0, 1, 2, 3, 4])
+        self.assertTrue(q.empty())
+    
+    def test_respects_max_items(self):
+        """Only max_items are removed; the rest stay queued."""
+        q = queue.Queue()
+        for i in range(5):
+            q.put(i)
+        
+        self.assertEqual(drain_queue(q, max_items=3), [0, 1, 2])
+        self.assertEqual(q.qsize(), 2)
+        self.assertEqual(drain_queue(q, max_items=3), [3, 4])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+# test_topic_router.py
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import queue
+import unittest
+from datetime import datetime
+from unittest.mock import MagicMock
+
+from topic_router import TopicRouter
+from TopicsUI import Topic
+
+class TestTopicRouter(unittest.TestCase):
+    """Tests for routing bursts of topics to the UI and the browser."""
+
+    def setUp(self):
+        self.state_manager = MagicMock()
+        self.service_manager = MagicMock()
+        self.service_manager.browser_manager.browser_queue = queue.SimpleQueue()
+        self.ui_controller = MagicMock()
+        self.router = TopicRouter(self.state_manager, self.service_manager, self.ui_controller)
+
+    def _topics(self):
+        ts = datetime(2024, 1, 15, 14, 30, 0)
+        return [
+            Topic("o1", ts, "OTHERS"),
+            Topic("m1", ts, "ME"),
+            Topic("o2", ts, "OTHERS"),
+            Topic("m2", ts, "ME"),
+        ]
+
+    def test_mixed_burst_keeps_arrival_order_in_ui(self):
+        """Auto-submitted and regular topics reach the UI in the order they arrived."""
+        self.state_manager.auto_submit_mode = "Others"
+        topics = self._topics()
+
+        self.router.route_topic_batch(topics)
+
+        routed = [call.args[0].text for call in self.ui_controller.add_topic_to_queue.call_args_list]
+        self.assertEqual(routed, ["o1", "m1", "o2", "m2"])
+        marked = [call.args[0].text for call in self.ui_controller.mark_topic_as_auto_submitted.call_args_list]
+        self.assertEqual(marked, ["o1", "o2"])
+
+    def test_mixed_burst_sends_one_browser_payload(self):
+        """All auto-submitted topics in a burst go to the browser as a single payload."""
+        self.state_manager.auto_submit_mode = "Others"
+        topics = self._topics()
+
+        self.router.route_topic_batch(topics)
+
+        browser_queue = self.service_manager.browser_manager.browser_queue
+        payload = browser_queue.get_nowait()
+        self.assertEqual(payload['content'], "[OTHERS] o1\n[OTHERS] o2")
+        self.assertEqual([t.text for t in payload['topic_objects']], ["o1", "o2"])
+        self.assertTrue(browser_queue.empty())
+
+    def test_manual_mode_sends_nothing_to_browser(self):
+        """With auto-submit off, every topic goes to the UI and nothing is queued for the browser."""
+        self.state_manager.auto_submit_mode = "Off"
+
+        self.router.route_topic_batch(self._topics())
+
+        self.assertEqual(self.ui_controller.add_topic_to_queue.call_count, 4)
+        self.ui_controller.mark_topic_as_auto_submitted.assert_not_called()
+        self.assertTrue(self.service_manager.browser_manager.browser_queue.empty())
+
+if __name__ == '__main__':
+    unittest.main()
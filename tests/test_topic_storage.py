@@ -76,16 +76,28 @@ class TestTopicStorageManager(unittest.TestCase):
         self.assertFalse(result)
     
     @patch('topic_storage.datetime')
-    def test_generate_filename_basic(self, mock_datetime):
-        """Test basic filename generation."""
+    def test_candidate_filenames_order(self, mock_datetime):
+        """Test that candidate filenames start with the plain timestamp, then add a counter."""
         # Mock datetime to return predictable timestamp
         mock_datetime.now.return_value = datetime(2024, 1, 15, 14, 30, 25)
         
-        filename = self.storage_manager._generate_filename()
-        self.assertEqual(filename, "topics_20240115_143025.txt")
+        candidates = self.storage_manager._candidate_filenames()
+        self.assertEqual(next(candidates), "topics_20240115_143025.txt")
+        self.assertEqual(next(candidates), "topics_20240115_143025_001.txt")
+        self.assertEqual(next(candidates), "topics_20240115_143025_002.txt")
     
     @patch('topic_storage.datetime')
-    def test_generate_filename_collision_handling(self, mock_datetime):
+    def test_create_session_file_basic(self, mock_datetime):
+        """Test that a session file is created under the plain timestamp name."""
+        mock_datetime.now.return_value = datetime(2024, 1, 15, 14, 30, 25)
+        
+        file_path, file_handle = self.storage_manager._create_session_file()
+        file_handle.close()
+        self.assertEqual(os.path.basename(file_path), "topics_20240115_143025.txt")
+        self.assertTrue(os.path.exists(file_path))
+    
+    @patch('topic_storage.datetime')
+    def test_create_session_file_collision_handling(self, mock_datetime):
         """Test filename collision handling."""
         # Mock datetime to return predictable timestamp
         mock_datetime.now.return_value = datetime(2024, 1, 15, 14, 30, 25)
@@ -95,8 +107,24 @@ class TestTopicStorageManager(unittest.TestCase):
         with open(collision_file, 'w') as f:
             f.write("existing file")
         
-        filename = self.storage_manager._generate_filename()
-        self.assertEqual(filename, "topics_20240115_143025_001.txt")
+        file_path, file_handle = self.storage_manager._create_session_file()
+        file_handle.close()
+        self.assertEqual(os.path.basename(file_path), "topics_20240115_143025_001.txt")
+    
+    @patch('topic_storage.datetime')
+    def test_start_session_does_not_overwrite_existing_file(self, mock_datetime):
+        """Test that a session never truncates a file that already has its name."""
+        mock_datetime.now.return_value = datetime(2024, 1, 15, 14, 30, 25)
+        
+        collision_file = os.path.join(self.test_dir, "topics_20240115_143025.txt")
+        with open(collision_file, 'w') as f:
+            f.write("existing file")
+        
+        self.assertTrue(self.storage_manager.start_session())
+        self.assertEqual(os.path.basename(self.storage_manager.current_session.file_path),
+                         "topics_20240115_143025_001.txt")
+        with open(collision_file, 'r') as f:
+            self.assertEqual(f.read(), "existing file")
     
     def test_start_session_success(self):
         """Test successful session start."""
@@ -194,5 +222,25 @@ class TestTopicStorageManager(unittest.TestCase):
             self.assertIn("[14:30] [ME] First topic", content)
             self.assertIn("[14:31] [OTHERS] Second topic", content)
 
+    def test_store_topics_batch(self):
+        """Test storing a batch of topics with a single write."""
+        self.storage_manager.start_session()
+        
+        topics = [
+            MockTopic("First topic", datetime(2024, 1, 15, 14, 30, 25), "ME"),
+            MockTopic("Second topic", datetime(2024, 1, 15, 14, 31, 10), "OTHERS"),
+        ]
+        
+        self.assertTrue(self.storage_manager.store_topics(topics))
+        self.assertEqual(self.storage_manager.current_session.topic_count, 2)
+        
+        with open(self.storage_manager.current_session.file_path, 'r') as f:
+            content = f.read()
+            self.assertIn("[14:30] [ME] First topic\n[14:31] [OTHERS] Second topic\n", content)
+    
+    def test_store_topics_empty_batch(self):
+        """Test that an empty batch is a no-op, even without an active session."""
+        self.assertTrue(self.storage_manager.store_topics([]))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
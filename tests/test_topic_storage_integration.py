@@ -12,7 +12,7 @@ from unittest.mock import patch, MagicMock
 
 # Import the classes we need to test
 from topic_storage import TopicStorageManager
-from TopicsUI import Topic
+from TopicsUI import Topic, UIController
 
 class TestTopicStorageIntegration(unittest.TestCase):
     """Integration tests for topic storage functionality."""
@@ -219,5 +219,59 @@ class TestTopicStorageIntegration(unittest.TestCase):
         actual_files = set(os.listdir(self.test_dir))
         self.assertEqual(file_names, actual_files)
 
+class TestUIControllerStorageShutdown(unittest.TestCase):
+    """Tests that the UI controller's storage writer is flushed on shutdown."""
+    
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        # Real controller with a stubbed root and view; topics are stored in the test directory
+        with patch('TopicsUI.UIView'), patch('TopicsUI.TOPIC_STORAGE_FOLDER', self.test_dir):
+            self.controller = UIController(MagicMock(), MagicMock())
+        self.controller.view.listen_var.get.return_value = True
+    
+    def tearDown(self):
+        self.controller.close_storage()
+        if os.path.exists(self.test_dir):
+            shutil.rmtree(self.test_dir)
+    
+    def _read_session_file(self):
+        files = os.listdir(self.test_dir)
+        self.assertEqual(len(files), 1)
+        with open(os.path.join(self.test_dir, files[0]), 'r', encoding='utf-8') as f:
+            return f.read()
+    
+    def test_close_storage_flushes_queued_topics(self):
+        """Drained topics, undrained topics and the session footer all reach the file."""
+        self.controller.toggle_listening()
+        self.controller.add_topic_to_queue(Topic("First topic", datetime(2024, 1, 15, 14, 30, 0), "ME"))
+        self.controller.add_topic_to_queue(Topic("Second topic", datetime(2024, 1, 15, 14, 31, 0), "OTHERS"))
+        self.controller._drain_topic_queue()
+        # Arrives after the last drain, so it only exists in the controller's topic queue
+        self.controller.stop_topic_events()
+        self.controller.add_topic_to_queue(Topic("Undrained topic", datetime(2024, 1, 15, 14, 32, 0), "ME"))
+        
+        self.controller.close_storage()
+        
+        self.assertFalse(self.controller._storage_thread.is_alive())
+        content = self._read_session_file()
+        self.assertIn("[14:30] [ME] First topic", content)
+        self.assertIn("[14:31] [OTHERS] Second topic", content)
+        self.assertIn("[14:32] [ME] Undrained topic", content)
+        self.assertIn("=== TOPICS CAPTURED: 3 ===", content)
+    
+    def test_stop_topic_events_skips_wakeup(self):
+        """After stop_topic_events, topics are still queued but the Tk thread is not signalled."""
+        self.controller.stop_topic_events()
+        self.controller.add_topic_to_queue(Topic("Late topic", datetime(2024, 1, 15, 14, 33, 0), "ME"))
+        
+        self.controller.root.event_generate.assert_not_called()
+        self.assertEqual(len(self.controller.topic_queue), 1)
+    
+    def test_close_storage_is_idempotent(self):
+        """A second close does nothing and does not block."""
+        self.controller.close_storage()
+        self.controller.close_storage()
+        self.assertFalse(self.controller._storage_thread.is_alive())
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
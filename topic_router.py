@@ -1,7 +1,6 @@
 # topic_router.py
 import logging
-import queue
-from typing import Dict
+from typing import List
 
 from TopicsUI import Topic
 from managers import StateManager, ServiceManager
@@ -18,41 +17,41 @@ class TopicRouter:
         self.ui_controller = ui_controller
 
     def route_topic(self, topic: Topic):
-        should_auto_submit = (
+        self.route_topic_batch([topic])
+
+    def route_topic_batch(self, topics: List[Topic]):
+        """Route a burst of topics, sending all auto-submitted ones to the browser as one queue item."""
+        to_browser = []
+        for topic in topics:
+            if self._should_auto_submit(topic):
+                # Mark first (will appear grayed out) so it never shows as unsubmitted; it still
+                # goes to the UI, in arrival order, so it's visible and recoverable
+                self.ui_controller.mark_topic_as_auto_submitted(topic)
+                to_browser.append(topic)
+            self._route_to_ui(topic)
+
+        if to_browser:
+            self._route_to_browser(to_browser)
+
+    def _should_auto_submit(self, topic: Topic) -> bool:
+        return (
             self.state_manager.auto_submit_mode == "All" or
             (self.state_manager.auto_submit_mode == "Others" and topic.source == "OTHERS")
         )
 
-        if should_auto_submit:
-            self._route_to_browser(topic)
-        else:
-            self._route_to_ui(topic)
-
-    def _route_to_browser(self, topic: Topic):
-        # First add the topic to the UI so it's visible and recoverable
-        self._route_to_ui(topic)
-        
-        # Mark the topic as auto-submitted (will appear grayed out)
-        # We need to do this after a short delay to ensure the topic is processed by the UI queue
-        import threading
-        def mark_submitted():
-            import time
-            time.sleep(0.1)  # Small delay to ensure topic is added to UI
-            self.ui_controller.mark_topic_as_auto_submitted(topic)
-        
-        threading.Thread(target=mark_submitted, daemon=True).start()
-        
+    def _route_to_browser(self, topics: List[Topic]):
         if self.service_manager.browser_manager:
-            submission_content = f"[{topic.source}] {topic.text}"
+            # The browser loop joins batched items with newlines, so one item per burst is equivalent
+            submission_content = "\n".join(topic.get_tagged_text() for topic in topics)
             browser_payload = {
                 'content': submission_content,
-                'topic_objects': [topic]  # Include the topic object for recovery and UI updates
+                'topic_objects': topics  # Include the topic objects for recovery and UI updates
             }
             self.service_manager.browser_manager.browser_queue.put(browser_payload)
-            logger.info(f"AUTO-SUBMIT to browser: {submission_content[:50]}...")
+            logger.info("AUTO-SUBMIT to browser (%d topics): %.50s...", len(topics), submission_content)
         else:
             logger.warning("Cannot auto-submit, browser_manager not available.")
 
     def _route_to_ui(self, topic: Topic):
         self.ui_controller.add_topic_to_queue(topic)
-        logger.info(f"ROUTED to UI: [{topic.source}] {topic.text[:50]}...")
+        logger.info("ROUTED to UI: [%s] %.50s...", topic.source, topic.text)
@@ -35,35 +35,37 @@ class TopicStorageManager:
         self.current_session: Optional[StorageSession] = None
         logger.info(f"TopicStorageManager initialized with folder: {storage_folder_path}")
     
-    def _generate_filename(self) -> str:
+    def _candidate_filenames(self):
         """
-        Generate a unique filename based on current timestamp.
+        Yield storage filenames for the current timestamp, most preferred first.
         
-        Uses format: topics_YYYYMMDD_HHMMSS.txt
-        If filename already exists, appends a counter: topics_YYYYMMDD_HHMMSS_001.txt
+        Uses format: topics_YYYYMMDD_HHMMSS.txt, then topics_YYYYMMDD_HHMMSS_001.txt
+        and so on up to _999 for collisions.
+        """
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        yield f"topics_{timestamp}.txt"
+        for counter in range(1, 1000):
+            yield f"topics_{timestamp}_{counter:03d}.txt"
+        logger.error(f"Too many filename collisions for timestamp {timestamp}")
+    
+    def _create_session_file(self):
+        """
+        Create a new storage file under the first free candidate name.
+        
+        Opening with mode 'x' both checks for and claims the name in one call,
+        so no separate existence check is needed and a file created concurrently
+        by another instance is never truncated.
         
         Returns:
-            Unique filename for the storage file
+            Tuple of (file_path, file_handle)
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        base_filename = f"topics_{timestamp}.txt"
-        full_path = os.path.join(self.storage_folder, base_filename)
-        
-        # Handle filename collisions by appending counter
-        counter = 1
-        while os.path.exists(full_path):
-            collision_filename = f"topics_{timestamp}_{counter:03d}.txt"
-            full_path = os.path.join(self.storage_folder, collision_filename)
-            counter += 1
-            
-            # Safety check to prevent infinite loop
-            if counter > 999:
-                logger.error(f"Too many filename collisions for timestamp {timestamp}")
-                break
-        
-        filename = os.path.basename(full_path)
-        logger.debug(f"Generated filename: {filename}")
-        return filename
+        for filename in self._candidate_filenames():
+            file_path = os.path.join(self.storage_folder, filename)
+            try:
+                return file_path, open(file_path, 'x', encoding='utf-8')
+            except FileExistsError:
+                continue
+        raise FileExistsError(f"No free storage filename in {self.storage_folder}")
     
     def _ensure_storage_directory(self) -> bool:
         """
@@ -113,12 +115,9 @@ class TopicStorageManager:
             return False
         
         try:
-            # Generate unique filename and create file
-            filename = self._generate_filename()
-            file_path = os.path.join(self.storage_folder, filename)
-            
-            # Open file for writing
-            file_handle = open(file_path, 'w', encoding='utf-8')
+            # Create the file under a unique timestamped name
+            file_path, file_handle = self._create_session_file()
+            filename = os.path.basename(file_path)
             
             # Create session object
             start_time = datetime.now()
@@ -193,6 +192,24 @@ class TopicStorageManager:
         Returns:
             True if topic was stored successfully, False otherwise
         """
+        return self.store_topics([topic])
+    
+    def store_topics(self, topics) -> bool:
+        """
+        Store a batch of topics to the current active storage file.
+        
+        All lines are written with a single write and flush, so a burst of
+        topics costs one flush instead of one per topic.
+        
+        Args:
+            topics: Sequence of Topic objects with text, timestamp, and source attributes
+            
+        Returns:
+            True if the topics were stored successfully, False otherwise
+        """
+        if not topics:
+            return True
+        
         if self.current_session is None:
             logger.warning("Cannot store topic: no active storage session")
             return False
@@ -203,19 +220,20 @@ class TopicStorageManager:
         
         try:
             # Format topic data for storage
-            timestamp_str = topic.timestamp.strftime('%H:%M')
-            topic_line = f"[{timestamp_str}] [{topic.source}] {topic.text}\n"
+            topic_lines = "".join(
+                f"[{topic.timestamp.strftime('%H:%M')}] [{topic.source}] {topic.text}\n" for topic in topics
+            )
             
             # Write to file and flush immediately for crash protection
-            self.current_session.file_handle.write(topic_line)
+            self.current_session.file_handle.write(topic_lines)
             self.current_session.file_handle.flush()
             
             # Update session statistics
-            self.current_session.topic_count += 1
+            self.current_session.topic_count += len(topics)
             
-            logger.debug(f"Stored topic from {topic.source}: {topic.text[:50]}...")
+            logger.debug(f"Stored {len(topics)} topic(s) to {os.path.basename(self.current_session.file_path)}")
             return True
             
         except Exception as e:
             logger.error(f"Failed to store topic: {e}")
-            return False
\ No newline at end of file
+            return False
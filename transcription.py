@@ -7,15 +7,14 @@ import logging
 from typing import Dict, Optional, Any
 import os
 import re
+import importlib.util
 from datetime import datetime
 from TopicsUI import Topic
 
 # Conditional imports for optional dependencies
-try:
-    import torch
-    TORCH_AVAILABLE = True
-except ImportError:
-    TORCH_AVAILABLE = False
+# PyTorch is only probed here; it is imported on first use via _get_torch() so that
+# app startup doesn't pay for loading the CUDA runtime.
+TORCH_AVAILABLE = importlib.util.find_spec("torch") is not None
 
 try:
     from faster_whisper import WhisperModel
@@ -105,6 +104,12 @@ def initialize_transcription_manager() -> TranscriptionManager:
 
     # Initialize local GPU strategy only if ModelService is not being used
     if not _use_model_service and config_validation["should_load_local_model"]:
+        # torch is only needed when the model runs in this process
+        try:
+            configure_torch_precision()
+        except Exception as e:
+            logger.warning(f"Could not configure PyTorch precision settings: {e}")
+        
         try:
             local_config = StrategyConfig(
                 name="local_gpu",
@@ -321,9 +326,49 @@ def get_transcription_health_status() -> Dict[str, Dict]:
     
     return _transcription_manager.get_strategy_health()
 
+def _get_torch():
+    """Import torch on first use. Returns None if it isn't installed."""
+    if not TORCH_AVAILABLE:
+        return None
+    import torch
+    return torch
+
+def _is_cuda_available() -> bool:
+    torch = _get_torch()
+    return torch is not None and torch.cuda.is_available()
+
+def configure_torch_precision():
+    """
+    Enable TF32 for better performance if available (tensor cores require Ampere / SM 8.0+).
+    Set VOICE_DISABLE_TF32=1 to keep bit-exact FP32 math for reproducibility.
+
+    These switches only reach PyTorch's own kernels. Whisper inference runs in CTranslate2,
+    which manages its own cuBLAS/cuDNN handles and ignores torch.backends flags such as
+    cudnn.benchmark; its one-time kernel setup is paid by warmup_whisper_model instead.
+    """
+    if not _is_cuda_available():
+        return
+    torch = _get_torch()
+    
+    major, minor = torch.cuda.get_device_capability(0)
+    supports_tf32 = major >= 8
+    tf32_disabled = os.getenv("VOICE_DISABLE_TF32", "").strip().lower() in ("1", "true", "yes")
+    if supports_tf32 and not tf32_disabled:
+        torch.set_float32_matmul_precision('high')
+        # set_float32_matmul_precision does not cover cuDNN convolutions
+        torch.backends.cudnn.allow_tf32 = True
+        tf32_status = "enabled"
+    else:
+        torch.set_float32_matmul_precision('highest')
+        torch.backends.cudnn.allow_tf32 = False
+        tf32_status = "disabled by VOICE_DISABLE_TF32" if supports_tf32 else "not supported, using FP32"
+    logger.info(f"[CUDA] {torch.cuda.get_device_name(0)} (compute {major}.{minor}) — TF32 {tf32_status}")
+    if not supports_tf32:
+        logger.warning("GPU predates Ampere; Whisper inference will run in full FP32 and may be slower.")
+
 def is_gpu_available() -> bool:
     """Check if GPU is available for local transcription"""
-    return TORCH_AVAILABLE and FASTER_WHISPER_AVAILABLE and torch.cuda.is_available()
+    return FASTER_WHISPER_AVAILABLE and _is_cuda_available()
 
 def is_local_transcription_available() -> bool:
     """Check if local transcription (GPU or CPU) is available"""
@@ -394,8 +439,8 @@ def optimize_transcription_memory():
             gc.collect()
             
             # Clear CUDA cache if available
-            if TORCH_AVAILABLE and torch.cuda.is_available():
-                torch.cuda.empty_cache()
+            if _is_cuda_available():
+                _get_torch().cuda.empty_cache()
                 logger.debug("CUDA cache cleared")
                 
         logger.debug("Transcription memory optimization completed")
@@ -425,21 +470,25 @@ def cleanup_transcription_system():
         gc.collect()
         
         # Clear CUDA cache if available
-        if TORCH_AVAILABLE and torch.cuda.is_available():
-            torch.cuda.empty_cache()
+        if _is_cuda_available():
+            _get_torch().cuda.empty_cache()
             
         logger.info("Transcription system cleanup completed")
         
     except Exception as e:
         logger.error(f"Error cleaning up transcription system: {e}")
 
-def transcription_thread(audio_queue: queue.Queue,
-                         transcribed_topics_queue: queue.Queue,
+def transcription_thread(audio_queue: queue.SimpleQueue,
+                         transcribed_topics_queue: queue.SimpleQueue,
                          run_threads_ref: Dict[str, bool],
                          exception_notifier=None) -> None:
     """
     Thread that processes audio segments, converts speech to text using TranscriptionManager,
     and puts the resulting Topic object into a queue.
+    
+    With the shared ModelService available, Whisper inference runs in that separate
+    process and this thread only encodes WAV and waits on HTTP, so it does not
+    compete with the recorders or the Tk loop for the GIL.
     """
     logger.info("Initializing transcription manager...")
     
@@ -486,9 +535,12 @@ def transcription_thread(audio_queue: queue.Queue,
                 
             # Get the next audio segment with a timeout to allow checking run_threads
             try:
-                audio_segment = audio_queue.get(timeout=1)
+                audio_segment = audio_queue.get(timeout=0.5)
             except queue.Empty:
                 continue
+            if audio_segment is None:
+                # Shutdown sentinel from ServiceManager.shutdown_services
+                break
                 
             # Process the audio segment
             source_prefix = f"[{audio_segment.source}]"
@@ -540,7 +592,6 @@ def transcription_thread(audio_queue: queue.Queue,
                     if exception_notifier:
                         exception_notifier.clear_exception_status("transcription")
 
-                audio_queue.task_done()
                 logger.debug(f"Processed segment in {result.processing_time:.2f}s using {result.method_used}")
                     
             except Exception as e:
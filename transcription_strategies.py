@@ -14,6 +14,9 @@ from audio_handler import AudioSegment
 # Configure logger for this module
 logger = logging.getLogger(__name__)
 
+# Runs of two or more spaces in transcript text, collapsed to one
+_MULTI_SPACE_RE = re.compile(r" {2,}")
+
 
 def apply_hallucination_filter(text: str) -> str:
     """
@@ -44,7 +47,7 @@ def process_whisper_segments(segments) -> str:
     if not segment_list:
         return ""
     transcript_text = " ".join(seg.text for seg in segment_list)
-    cleaned_text = re.sub(r" {2,}", " ", transcript_text.strip())
+    cleaned_text = _MULTI_SPACE_RE.sub(" ", transcript_text.strip())
     return apply_hallucination_filter(cleaned_text)
 
 
@@ -209,6 +212,10 @@ class LocalGPUTranscriptionStrategy(TranscriptionStrategy):
             
             self.logger.info(f"faster-whisper model loaded successfully on {self._device}")
             
+            # Pay the first-call CUDA init cost now rather than on the first utterance
+            from whisper_server_base import warmup_whisper_model
+            warmup_whisper_model(self._model, self._device)
+            
         except Exception as e:
             self.logger.error(f"Error initializing faster-whisper: {e}")
             self._record_error(e)
@@ -462,7 +469,7 @@ class GroqAPITranscriptionStrategy(TranscriptionStrategy):
         
         if result_text:
             # Replace multiple consecutive spaces with a single space
-            result_text = re.sub(r' {2,}', ' ', result_text)
+            result_text = _MULTI_SPACE_RE.sub(' ', result_text)
             filtered = apply_hallucination_filter(result_text)
             if not filtered:
                 self.logger.info(f"Filtered out likely hallucination: {result_text}")
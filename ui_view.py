@@ -24,6 +24,9 @@ class UIView(ttk.Frame):
         self.transcription_method_var = tk.StringVar(value="")
         self.transcription_method_menu = None
 
+        # (color, message) currently shown in the status bar, so repeated updates skip the Tk calls
+        self._shown_status = None
+
         self.create_widgets()
 
     def create_widgets(self):
@@ -298,6 +301,9 @@ class UIView(ttk.Frame):
     def update_browser_status(self, status_key: str, custom_message: Optional[str] = None):
         color, default_message = self.status_colors.get(status_key, ("gray", "Status: Unknown"))
         message_to_display = custom_message if custom_message is not None else default_message
+        if (color, message_to_display) == self._shown_status:
+            return
+        self._shown_status = (color, message_to_display)
         self.browser_status_indicator_label.config(foreground=color)
         self.status_message_label.config(text=message_to_display, foreground=color)
     
@@ -46,11 +46,39 @@ def load_whisper_model(model_name: str):
             download_root=MODELS_FOLDER,
         )
         logger.info(f"Model '{model_name}' loaded successfully.")
-        return model
     except Exception as exc:
         logger.error(f"Failed to load faster-whisper model '{model_name}': {exc}")
         sys.exit(1)
 
+    warmup_whisper_model(model, device)
+    return model
+
+
+def warmup_whisper_model(model, device: str) -> None:
+    """Run one short decode so the first real request doesn't pay one-time init costs.
+
+    CTranslate2 initialises CUDA kernels, cuBLAS handles and its allocator pool lazily
+    on the first transcribe() call.  CPU has no comparable setup cost and the decode would
+    only delay startup, so warmup runs on CUDA only.  Failures are logged and ignored.
+    """
+    if device != "cuda":
+        return
+    try:
+        import numpy as np
+        from config import LANGUAGE, BEAM_SIZE
+
+        start_time = time.time()
+        # One second of silence at Whisper's native 16 kHz sample rate
+        segments, _info = model.transcribe(
+            np.zeros(16000, dtype=np.float32),
+            language=LANGUAGE,
+            beam_size=BEAM_SIZE,
+        )
+        list(segments)  # segments is a lazy generator; consume it to run the decoder
+        logger.info(f"Model warmup completed in {time.time() - start_time:.2f}s")
+    except Exception as exc:
+        logger.warning(f"Model warmup failed, continuing without it: {exc}")
+
 
 def check_bearer_auth(request, api_key: Optional[str]) -> None:
     """Raise HTTP 401 if api_key is set and the request does not carry it.